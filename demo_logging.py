@@ -0,0 +1,21 @@
+"""
+Demo Logging
+
+데모 스크립트(tool_demo.py, vector_db_demo.py)가 함께 쓰는 출력 설정
+"""
+
+import logging
+import sys
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """레코드마다 flush하지 않는 StreamHandler - 출력은 stdout 버퍼가 찰 때와 종료 시에만 기록"""
+
+    def flush(self):
+        pass
+
+
+def setup_logging():
+    """데모 출력을 블록 버퍼링된 stdout 로거로 설정"""
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[BufferedStreamHandler(sys.stdout)])
@@ -62,3 +62,9 @@ app.include_router(db_router, prefix="/api")
 @app.get("/")
 def read_root():
     return {"message": "Welcome to PRISM Core", "version": "0.1.0"}
+
+
+@app.api_route("/health", methods=["GET", "HEAD"])
+def health():
+    """가벼운 상태 확인 (클라이언트는 HEAD로 본문 없이 확인 가능)"""
+    return {"status": "ok"}
@@ -0,0 +1,23 @@
+"""
+Environment helpers
+
+.env 파일은 프로세스당 한 번만 읽고, 스크립트들이 공통으로 쓰는 환경 변수 조회 함수를 제공합니다.
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """.env 파일 로드 (프로세스당 한 번만 파싱)"""
+    load_dotenv()
+
+
+def get_db_url(default: Optional[str] = None) -> Optional[str]:
+    """DATABASE_URL 환경 변수 반환 (없으면 default)"""
+    load_env()
+    return os.getenv("DATABASE_URL", default)
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+import uuid
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List, Dict, Any
 
 from .base import BaseLLMService
@@ -28,6 +30,11 @@ def create_llm_router(agent_registry: AgentRegistry, llm_service: BaseLLMService
     if tool_registry is None:
         tool_registry = ToolRegistry()
 
+    # Tool 목록 ETag에 붙는 프로세스별 토큰 (재시작 후 같은 version 값과 구분)
+    tools_etag_prefix = uuid.uuid4().hex[:12]
+    # Tool 상세 정보 캐시 (registry version을 키에 포함해 변경 시 자동으로 무효화)
+    tool_info_cache = TTLCache(maxsize=256, ttl=30)
+
     # PrismLLMService는 내장된 완전한 기능을 제공
 
     def get_agent_registry():
@@ -118,9 +125,15 @@ def create_llm_router(agent_registry: AgentRegistry, llm_service: BaseLLMService
     # Tool Management APIs
     @router.get("/tools", response_model=List[ToolInfo])
     async def list_tools(
+        request: Request,
+        response: Response,
         tool_registry: ToolRegistry = Depends(get_tool_registry)
     ):
-        """List all registered tools."""
+        """List all registered tools. Answers 304 when the client's ETag is current."""
+        etag = f'"{tools_etag_prefix}-{tool_registry.version}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
         return tool_registry.list_tools()
 
     @router.post("/tools", response_model=dict)
@@ -198,9 +211,13 @@ def create_llm_router(agent_registry: AgentRegistry, llm_service: BaseLLMService
         tool_registry: ToolRegistry = Depends(get_tool_registry)
     ):
         """Get detailed information about a specific tool."""
-        tool_info = tool_registry.get_tool_info(tool_name)
-        if not tool_info:
-            raise HTTPException(status_code=404, detail="Tool not found")
+        cache_key = (tool_name, tool_registry.version)
+        tool_info = tool_info_cache.get(cache_key)
+        if tool_info is None:
+            tool_info = tool_registry.get_tool_info(tool_name)
+            if not tool_info:
+                raise HTTPException(status_code=404, detail="Tool not found")
+            tool_info_cache[cache_key] = tool_info
         return tool_info
 
     @router.delete("/tools/{tool_name}")
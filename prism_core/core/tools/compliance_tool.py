@@ -123,6 +123,10 @@ class ComplianceTool(BaseTool):
                 error_message=f"규정 준수 검증 실패: {str(e)}"
             )
 
+    async def aclose(self) -> None:
+        """내부 RAG Search Tool의 연결 정리 - 이벤트 루프 종료 전에 호출"""
+        await self._rag_tool.aclose()
+
     async def _search_compliance_rules(self, action: str, context: str) -> List[Dict[str, Any]]:
         """RAG Search Tool을 사용하여 compliance 도메인에서 관련 규정 검색"""
         try:
@@ -5,12 +5,174 @@ RAG Search Tool
 PRISM Core의 공통 설정을 사용합니다.
 """
 
+import gzip
+import time
+import logging
+import asyncio
+import threading
+import orjson
 import requests
-from typing import Dict, Any, List, Optional
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from string import Template
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
 from .base import BaseTool
 from .schemas import ToolRequest, ToolResponse
 from ..config import settings
 
+try:
+    # weaviate-client v4: gRPC 기반 query/batch API (v3에는 weaviate.classes가 없음)
+    import weaviate
+    from weaviate.classes.query import MetadataQuery
+    WEAVIATE_V4_AVAILABLE = True
+except ImportError:
+    WEAVIATE_V4_AVAILABLE = False
+
+try:
+    # 검색 경로의 비동기 HTTP (없으면 requests를 스레드에서 실행)
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# compress_requests=True일 때 이보다 큰 요청 본문은 gzip으로 압축해 전송 (작은 본문은 압축 비용이 더 큼)
+_GZIP_MIN_BYTES = 4096
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+# 서버가 gzip 본문을 거부할 때의 응답 - 압축 없이 다시 보냄
+_GZIP_REJECTED_STATUS = (400, 415)
+
+# 도메인별 시드 문서 (임포트 시 한 번만 생성)
+_RESEARCH_DOCS = tuple(
+    {
+        "title": f"Paper {i+1}",
+        "content": f"제조 공정 최적화 기술 문서 {i+1}: 공정 제어, 안전 규정, 예지 정비, 데이터 기반 분석.",
+        "metadata": "{}"
+    }
+    for i in range(10)
+)
+_HISTORY_DOCS = tuple(
+    {
+        "title": f"History {i+1}",
+        "content": f"사용자 수행 내역 {i+1}: 압력 이상 대응, 점검 절차 수행, 원인 분석 리포트, 후속 조치 완료.",
+        "metadata": "{}"
+    }
+    for i in range(10)
+)
+_COMPLIANCE_DOCS = tuple(
+    {
+        "title": f"Regulation {i+1}",
+        "content": f"안전 규정 {i+1}: 개인보호구 착용, 작업 허가서 발급, 위험성 평가, 비상 대응 절차.",
+        "metadata": "{}"
+    }
+    for i in range(10)
+)
+
+# 도메인 정의: (클래스 접미사, 설명, 속성 설명 명사, 시드 문서)
+_DOMAINS = [
+    ("Research", "Papers/technical docs knowledge base", "Document", _RESEARCH_DOCS),
+    ("History", "All users' past execution logs", "History", _HISTORY_DOCS),
+    ("Compliance", "Safety regulations and compliance guidelines", "Regulation", _COMPLIANCE_DOCS),
+]
+
+
+def _schema_property(name: str, skip: bool) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "dataType": ["text"],
+        "description": f"$noun {name}",
+        "moduleConfig": {
+            "text2vec-transformers": {
+                "skip": skip,
+                "vectorizePropertyName": False
+            }
+        }
+    }
+
+
+# 클래스 스키마는 임포트 시 한 번만 직렬화하고 클래스명/설명만 치환
+_SCHEMA_TEMPLATE = Template(orjson.dumps({
+    "class": "$class_name",
+    "description": "$description",
+    "vectorizer": "text2vec-transformers",
+    "moduleConfig": {
+        "text2vec-transformers": {
+            "vectorizeClassName": False,
+            "poolingStrategy": "masked_mean",
+            "vectorizePropertyName": False
+        }
+    },
+    "properties": [
+        _schema_property("title", skip=False),
+        _schema_property("content", skip=False),
+        _schema_property("metadata", skip=True),
+    ]
+}).decode())
+
+
+_EMPTY_META = orjson.dumps({}).decode()
+
+
+def _dump_metadata(metadata: Any) -> str:
+    """메타데이터를 JSON 문자열로 직렬화 (이미 문자열이면 그대로 사용)"""
+    if not metadata:
+        return _EMPTY_META
+    if isinstance(metadata, str):
+        return metadata
+    return orjson.dumps(metadata, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _encode_body(payload: Any, compress: bool = False) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """요청 본문 직렬화 - compress면 큰 본문은 gzip 압축 후 (본문, 추가 헤더) 반환"""
+    body = orjson.dumps(payload)
+    if compress and len(body) > _GZIP_MIN_BYTES:
+        return gzip.compress(body, compresslevel=5), _GZIP_HEADERS
+    return body, None
+
+
+def _json_text(value: str) -> str:
+    """JSON 문자열 리터럴 내부에 들어갈 수 있도록 이스케이프"""
+    return orjson.dumps(value).decode()[1:-1]
+
+# 벡터화 재확인 지수 백오프 (초) - 준비되는 즉시 반환
+_VECTORIZATION_BACKOFF = (0.1, 0.2, 0.4, 0.8)
+
+# GraphQL 벡터 확인 시 한 번에 조회할 객체 ID 수
+_VERIFY_BATCH_SIZE = 50
+
+# REST 배치 크기 자동 조정: 429/5xx/타임아웃이거나 지연되면 절반, 연속 성공 시 두 배
+_INITIAL_BATCH_SIZE = 32
+_MIN_BATCH_SIZE = 8
+_MAX_BATCH_SIZE = 256
+_SLOW_BATCH_SECONDS = 8.0
+_FAST_BATCH_SECONDS = 5.0
+_GROW_AFTER_FAST_BATCHES = 10
+
+
+def _upload_shard(tool_kwargs: Dict[str, Any], documents: List[Dict[str, Any]], domain: str,
+                  batch_size: Optional[int], wait_for_vectorization: bool) -> Tuple[int, int, int]:
+    """작업 스레드에서 문서 샤드 하나를 업로드 - (성공, 실패, 벡터화) 개수 반환
+
+    샤드마다 별도 RAGSearchTool(연결/배치 크기 상태)을 만들어 스레드 간에 공유하지 않는다.
+    인덱스는 호출한 Tool에서 이미 준비했으므로 초기화/시딩은 건너뛴다.
+    """
+    tool = RAGSearchTool(**tool_kwargs)
+    tool._initialized = True
+    try:
+        class_name = tool._get_class_name(domain)
+        client = tool._get_v4_client()
+        if client is not None:
+            return tool._batch_upload_grpc(client, documents, class_name, wait_for_vectorization)
+        return tool._batch_upload_rest(documents, class_name, batch_size, wait_for_vectorization)
+    finally:
+        tool.close()
+
 
 class RAGSearchTool(BaseTool):
     """
@@ -22,13 +184,22 @@ class RAGSearchTool(BaseTool):
     - compliance: 안전 규정 및 법규
     """
     
+    # 프로세스 전역 초기화 상태 - (weaviate_url, class_prefix)별로 한 번만 인덱스 생성/시딩
+    _inited_keys: set = set()
+    # 인덱스 생성과 시딩이 모두 성공한 (weaviate_url, 클래스명) - 재시도 시 중복 시딩 방지
+    _seeded_classes: set = set()
+    _init_locks: Dict[Tuple[str, str], threading.Lock] = {}
+    _init_locks_guard = threading.Lock()
+    
     def __init__(self, 
                  weaviate_url: Optional[str] = None,
                  encoder_model: Optional[str] = None,
                  vector_dim: Optional[int] = None,
                  client_id: str = "default",
                  class_prefix: str = "Default",
-                 tool_type: str = "api"):
+                 tool_type: str = "api",
+                 grpc_port: int = 50051,
+                 compress_requests: bool = False):
         super().__init__(
             name="rag_search",
             description="지식 베이스에서 관련 정보를 검색합니다",
@@ -54,13 +225,48 @@ class RAGSearchTool(BaseTool):
         self._encoder = encoder_model or settings.VECTOR_ENCODER_MODEL
         self._vector_dim = vector_dim or settings.VECTOR_DIM
         self._client_id = client_id
+        self._class_prefix = class_prefix
+        self._grpc_port = grpc_port
+        # 큰 요청 본문 gzip 전송 (서버가 Content-Encoding: gzip을 지원할 때만 켬)
+        self._compress_requests = compress_requests
+        
+        # Weaviate REST 호출용 세션 (keep-alive 연결 재사용)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._http.headers.update(_JSON_HEADERS)
+        
+        # 검색 결과 캐시 - (클래스, 쿼리, top_k) 기준, 5분 TTL
+        self._result_cache = TTLCache(maxsize=1024, ttl=300)
+        self._result_cache_lock = threading.Lock()
+        
+        # 검색 경로용 aiohttp 세션 (이벤트 루프 안에서 지연 생성)
+        self._aio_session = None
+        self._aio_loop = None
+        
+        # Weaviate v4 클라이언트 (gRPC, 지연 생성) - 사용할 수 없으면 REST API로 동작
+        self._client = None
+        self._client_unavailable = False
+        self._client_lock = threading.Lock()
+        
+        # REST 배치 업로드 시 현재 배치 크기 (응답 지연에 따라 자동 조정)
+        self._current_batch = _INITIAL_BATCH_SIZE
         
         # 에이전트별 클래스명 설정
-        self._class_research = f"{class_prefix}Research"
-        self._class_history = f"{class_prefix}History"
-        self._class_compliance = f"{class_prefix}Compliance"
+        self._class_names = {suffix.lower(): f"{class_prefix}{suffix}" for suffix, *_ in _DOMAINS}
+        self._class_research = self._class_names["research"]
+        self._class_history = self._class_names["history"]
+        self._class_compliance = self._class_names["compliance"]
         
         self._initialized = False
+        
+        # 존재가 확인된 클래스 (읽기 경로의 스키마 확인 결과 캐시)
+        self._known_classes = set()
 
     async def execute(self, request: ToolRequest) -> ToolResponse:
         """
@@ -74,9 +280,6 @@ class RAGSearchTool(BaseTool):
     """
         """도구를 실행합니다."""
         try:
-            # 인덱스 초기화 확인
-            self._ensure_index_and_seed()
-            
             # 파라미터 추출
             query = request.parameters.get("query", "")
             top_k = request.parameters.get("top_k", 3)
@@ -85,6 +288,9 @@ class RAGSearchTool(BaseTool):
             # 도메인별 클래스 선택
             class_name = self._get_class_name(domain)
             
+            # 읽기 경로는 클래스 존재만 확인 (시딩은 클래스가 없을 때만)
+            await asyncio.to_thread(self._ensure_schema_exists, class_name)
+            
             # 검색 실행
             results = await self._search_documents(query, class_name, top_k)
             for result in results:  
@@ -104,15 +310,198 @@ class RAGSearchTool(BaseTool):
 
     def _get_class_name(self, domain: str) -> str:
         """도메인에 따른 클래스명 반환"""
-        domain_map = {
-            "research": self._class_research,
-            "history": self._class_history,
-            "compliance": self._class_compliance
-        }
-        return domain_map.get(domain, self._class_research)
+        return self._class_names.get(domain, self._class_research)
+
+    def _get_v4_client(self):
+        """
+        Weaviate v4 클라이언트를 지연 생성 (gRPC를 사용할 수 없으면 None 반환)
+        연결은 블로킹 호출이므로 이벤트 루프에서는 _get_v4_client_async를 사용.
+        실패는 기억해 두고 이후 호출에서 연결 타임아웃을 반복하지 않음.
+        """
+        if not WEAVIATE_V4_AVAILABLE or self._client_unavailable:
+            return None
+        if self._client is not None:
+            return self._client
+        
+        # 여러 스레드가 동시에 클라이언트를 만들어 하나가 누수되지 않도록 잠금
+        with self._client_lock:
+            if self._client is not None or self._client_unavailable:
+                return self._client
+            try:
+                parsed = urlparse(self._weaviate_url)
+                host = parsed.hostname or "localhost"
+                secure = parsed.scheme == "https"
+                self._client = weaviate.connect_to_custom(
+                    http_host=host,
+                    http_port=parsed.port or 8080,
+                    http_secure=secure,
+                    grpc_host=host,
+                    grpc_port=self._grpc_port,
+                    grpc_secure=secure,
+                )
+            except Exception as e:
+                logger.warning("Weaviate gRPC 클라이언트 연결 실패 - REST API 사용: %s", e)
+                self._client_unavailable = True
+                return None
+        
+        return self._client
+
+    async def _get_v4_client_async(self):
+        """이벤트 루프를 막지 않도록 첫 연결은 스레드에서 수행하는 _get_v4_client"""
+        if self._client is not None or self._client_unavailable or not WEAVIATE_V4_AVAILABLE:
+            return self._client
+        return await asyncio.to_thread(self._get_v4_client)
+
+    def _request(self, method: str, path: str, json: Any = None, **kwargs) -> requests.Response:
+        """Weaviate REST 호출 - JSON 본문은 orjson으로 직렬화 (gzip이 거부되면 압축 없이 재전송)"""
+        url = f"{self._weaviate_url}{path}"
+        if json is None:
+            return self._http.request(method, url, **kwargs)
+        
+        data, headers = _encode_body(json, self._compress_requests)
+        base_headers = kwargs.pop("headers", None) or {}
+        response = self._http.request(method, url, data=data, headers={**(headers or {}), **base_headers}, **kwargs)
+        if headers and response.status_code in _GZIP_REJECTED_STATUS:
+            response.close()
+            self._disable_compression(response.status_code)
+            response = self._http.request(method, url, data=orjson.dumps(json), headers=base_headers, **kwargs)
+        return response
+    
+    def _disable_compression(self, status: int) -> None:
+        """서버가 gzip 요청 본문을 거부하면 이 인스턴스의 이후 요청은 압축하지 않음"""
+        logger.warning("Weaviate가 gzip 요청 본문을 거부함 (HTTP %s) - 압축 없이 전송", status)
+        self._compress_requests = False
+
+    def _get_aio_session(self):
+        """aiohttp 세션 반환 - 현재 이벤트 루프에 묶인 세션을 재사용"""
+        loop = asyncio.get_running_loop()
+        if self._aio_session is None or self._aio_session.closed or self._aio_loop is not loop:
+            # 다른 루프에 묶인 이전 세션은 버리기 전에 닫음 (연결 누수 방지)
+            self._drop_aio_session()
+            self._aio_session = aiohttp.ClientSession(
+                base_url=self._weaviate_url,
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60),
+                headers=_JSON_HEADERS,
+            )
+            self._aio_loop = loop
+        return self._aio_session
+    
+    def _drop_aio_session(self, blocking: bool = True) -> None:
+        """
+        현재 aiohttp 세션을 떼어내고, 세션이 속한 이벤트 루프에서 닫음 (동기 호출용)
+        blocking=False면 멈춰 있는 루프를 다시 돌리지 않음 (__del__ 등)
+        """
+        session, loop = self._aio_session, self._aio_loop
+        self._aio_session = None
+        self._aio_loop = None
+        if session is None or session.closed:
+            return
+        try:
+            if loop.is_running():
+                try:
+                    current = asyncio.get_running_loop()
+                except RuntimeError:
+                    current = None
+                if current is loop:
+                    loop.create_task(session.close())
+                else:
+                    asyncio.run_coroutine_threadsafe(session.close(), loop)
+            elif blocking and not loop.is_closed():
+                loop.run_until_complete(session.close())
+            else:
+                # 루프를 돌릴 수 없으면 커넥터만 분리 (세션 미종료 경고 방지)
+                session.detach()
+        except RuntimeError as e:
+            logger.warning("이전 aiohttp 세션을 닫지 못함: %s", e)
+            session.detach()
+    
+    async def _async_request(self, method: str, path: str, json: Any = None,
+                             params: Optional[Dict[str, Any]] = None, timeout: float = 10) -> Tuple[int, Any]:
+        """Weaviate REST 비동기 호출 - (상태 코드, 파싱된 본문) 반환 (200이 아니면 본문은 None)"""
+        data, headers = _encode_body(json, self._compress_requests) if json is not None else (None, None)
+        status, body = await self._async_send(method, path, data, headers, params, timeout)
+        if headers and status in _GZIP_REJECTED_STATUS:
+            self._disable_compression(status)
+            status, body = await self._async_send(method, path, orjson.dumps(json), None, params, timeout)
+        return status, body
+    
+    async def _async_send(self, method: str, path: str, data: Optional[bytes], headers: Optional[Dict[str, str]],
+                          params: Optional[Dict[str, Any]], timeout: float) -> Tuple[int, Any]:
+        """직렬화된 본문으로 비동기 요청 한 번 전송 - (상태 코드, 파싱된 본문) 반환"""
+        if not AIOHTTP_AVAILABLE:
+            response = await asyncio.to_thread(
+                self._request, method, path, data=data, params=params, headers=headers, timeout=timeout
+            )
+            return response.status_code, orjson.loads(response.content) if response.status_code == 200 else None
+        
+        session = self._get_aio_session()
+        async with session.request(
+            method, path, data=data, params=params, headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if response.status != 200:
+                return response.status, None
+            return response.status, orjson.loads(await response.read())
+    
+    async def aclose(self) -> None:
+        """비동기 세션 포함 연결 정리 - Tool 소유자가 이벤트 루프 종료 전에 호출"""
+        if self._aio_session is not None and self._aio_loop is asyncio.get_running_loop():
+            session = self._aio_session
+            self._aio_session = None
+            self._aio_loop = None
+            await session.close()
+        self.close()
+    
+    def close(self) -> None:
+        """Weaviate 연결 정리 (aiohttp 세션은 가능하면 자신의 루프에서 닫음 - 루프 안에서는 aclose 사용)"""
+        try:
+            self._drop_aio_session()
+            if self._client is not None:
+                self._client.close()
+        finally:
+            self._client = None
+            self._http.close()
+    
+    def __del__(self):
+        try:
+            self._drop_aio_session(blocking=False)
+            self.close()
+        except Exception:
+            pass
 
+    def clear_cache(self) -> None:
+        """검색 결과 캐시 비우기 (문서 업로드/시딩 후 호출)"""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
     async def _search_documents(self, query: str, class_name: str, top_k: int) -> List[Dict[str, Any]]:
+        """문서 검색 실행 - 최근 동일 검색은 캐시에서 반환"""
+        key = (class_name, query, top_k)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        results = await self._search_documents_uncached(query, class_name, top_k)
+        # 빈 결과는 오류로 인한 것일 수 있으므로 캐시하지 않음
+        if results:
+            with self._result_cache_lock:
+                self._result_cache[key] = results
+        return list(results)
+    
+    async def _search_documents_uncached(self, query: str, class_name: str, top_k: int) -> List[Dict[str, Any]]:
         """문서 검색 실행 - nearText를 기본으로 사용 (Weaviate가 자동으로 벡터화)"""
+        client = await self._get_v4_client_async()
+        if client is not None:
+            try:
+                formatted_results = await asyncio.to_thread(
+                    self._search_documents_grpc, client, query, class_name, top_k
+                )
+                logger.debug("nearText(gRPC) 검색 성공: %s개 결과", len(formatted_results))
+                return formatted_results
+            except Exception as e:
+                logger.warning("gRPC nearText 검색 실패 - REST로 재시도: %s", e)
+        
         try:
             # Weaviate의 text2vec-transformers가 자동으로 벡터화 처리
             # nearText가 가장 안정적이고 권장되는 방법
@@ -141,19 +530,13 @@ class RAGSearchTool(BaseTool):
                 '''
             }
             
-            response = requests.post(
-                f"{self._weaviate_url}/v1/graphql",
-                json=graphql_query,
-                headers={"Content-Type": "application/json"},
-                timeout=15,
-            )
+            status, data = await self._async_request("POST", "/v1/graphql", json=graphql_query, timeout=15)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 if "errors" in data:
-                    print(f"⚠️  GraphQL nearText 오류: {data['errors']}")
+                    logger.warning("GraphQL nearText 오류: %s", data['errors'])
                     # Fallback to basic search
-                    return self._fallback_search_documents(query, class_name, top_k)
+                    return await self._fallback_search_documents(query, class_name, top_k)
                 
                 results = data.get("data", {}).get("Get", {}).get(class_name, [])
                 
@@ -177,35 +560,59 @@ class RAGSearchTool(BaseTool):
                         "distance": distance
                     })
                 
-                print(f"✅ nearText 검색 성공: {len(formatted_results)}개 결과")
+                logger.debug("nearText 검색 성공: %s개 결과", len(formatted_results))
                 return formatted_results
             else:
-                print(f"⚠️  GraphQL nearText 검색 실패: {response.status_code}")
+                logger.warning("GraphQL nearText 검색 실패: %s", status)
                 # Fallback to basic search
-                return self._fallback_search_documents(query, class_name, top_k)
+                return await self._fallback_search_documents(query, class_name, top_k)
                 
         except Exception as e:
-            print(f"⚠️  nearText 검색 중 오류: {str(e)}")
+            logger.warning("nearText 검색 중 오류: %s", e)
             # Fallback to basic search
-            return self._fallback_search_documents(query, class_name, top_k)
+            return await self._fallback_search_documents(query, class_name, top_k)
 
 
-    def _fallback_search_documents(self, query: str, class_name: str, top_k: int) -> List[Dict[str, Any]]:
+    def _search_documents_grpc(self, client, query: str, class_name: str, top_k: int) -> List[Dict[str, Any]]:
+        """v4 클라이언트(gRPC)로 nearText 검색 - REST 결과와 동일한 구조로 반환"""
+        collection = client.collections.get(class_name)
+        response = collection.query.near_text(
+            query=query,
+            limit=top_k,
+            return_metadata=MetadataQuery(distance=True, certainty=True),
+        )
+        
+        return [
+            {
+                "class": class_name,
+                "id": str(obj.uuid),
+                "properties": {
+                    "title": obj.properties.get("title", ""),
+                    "content": obj.properties.get("content", ""),
+                    "metadata": obj.properties.get("metadata", "{}")
+                },
+                "vectorWeights": None,
+                "certainty": obj.metadata.certainty,
+                "distance": obj.metadata.distance
+            }
+            for obj in response.objects
+        ]
+
+    async def _fallback_search_documents(self, query: str, class_name: str, top_k: int) -> List[Dict[str, Any]]:
         """Fallback 단순 검색 - GraphQL이 실패할 때 사용"""
         try:
             # REST API로 모든 객체 조회
-            response = requests.get(
-                f"{self._weaviate_url}/v1/objects",
+            status, data = await self._async_request(
+                "GET",
+                "/v1/objects",
                 params={
                     "class": class_name,
                     "limit": top_k * 3  # 더 많이 가져와서 필터링
                 },
-                headers={"Content-Type": "application/json"},
                 timeout=10,
             )
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 objects = data.get("objects", [])
                 
                 # 간단한 키워드 매칭으로 필터링
@@ -223,321 +630,138 @@ class RAGSearchTool(BaseTool):
                 # 상위 top_k개만 반환
                 return filtered_objects[:top_k]
             else:
-                print(f"⚠️  Fallback 검색 실패: {response.status_code}")
+                logger.warning("Fallback 검색 실패: %s", status)
                 return []
                 
         except Exception as e:
-            print(f"⚠️  Fallback 검색 중 오류: {str(e)}")
+            logger.warning("Fallback 검색 중 오류: %s", e)
             return []
 
-    def _ensure_index_and_seed(self) -> None:
-        """인덱스 생성 및 초기 데이터 시딩"""
-        if self._initialized:
+    def _ensure_schema_exists(self, class_name: str) -> None:
+        """클래스 존재 여부만 가볍게 확인 (GET /v1/schema/{class}, 결과는 캐시)
+        
+        클래스가 없을 때만 전체 인덱스 생성 및 시딩을 수행한다.
+        """
+        if class_name in self._known_classes:
             return
-            
-        try:
-            # Research 인덱스 생성
-            self._create_research_index()
-            self._seed_research_data()
-            
-            # History 인덱스 생성
-            self._create_history_index()
-            self._seed_history_data()
-            
-            # Compliance 인덱스 생성
-            self._create_compliance_index()
-            self._seed_compliance_data()
-            
-            # 임베딩 검증 및 재생성
-            self._validate_and_regenerate_embeddings()
-            
-            self._initialized = True
-            
-        except Exception as e:
-            print(f"⚠️  인덱스 초기화 실패: {str(e)}")
-            self._initialized = True  # 실패해도 계속 진행
-
-    def _create_research_index(self) -> None:
-        """연구 문서 인덱스 생성"""
+        
         try:
-            # 기존 클래스가 있는지 확인
-            existing_response = requests.get(f"{self._weaviate_url}/v1/schema/{self._class_research}")
-            if existing_response.status_code == 200:
-                print(f"✅ {self._class_research} 클래스 이미 존재")
-                return
-                
-            response = requests.post(
-                f"{self._weaviate_url}/v1/schema",
-                json={
-                    "class": self._class_research,
-                    "description": "Papers/technical docs knowledge base",
-                    "vectorizer": "text2vec-transformers",
-                    "moduleConfig": {
-                        "text2vec-transformers": {
-                            "vectorizeClassName": False,
-                            "poolingStrategy": "masked_mean",
-                            "vectorizePropertyName": False
-                        }
-                    },
-                    "properties": [
-                        {
-                            "name": "title",
-                            "dataType": ["text"],
-                            "description": "Document title",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": False,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        },
-                        {
-                            "name": "content",
-                            "dataType": ["text"],
-                            "description": "Document content",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": False,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        },
-                        {
-                            "name": "metadata",
-                            "dataType": ["text"],
-                            "description": "Document metadata",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": True,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        }
-                    ]
-                },
-                timeout=10,
-            )
+            response = self._request("GET", f"/v1/schema/{class_name}", timeout=5)
             if response.status_code == 200:
-                print(f"✅ {self._class_research} 인덱스 생성 완료")
-        except Exception as e:
-            print(f"⚠️  인덱스 생성 실패: {str(e)}")
-
-    def _seed_research_data(self) -> None:
-        """연구 문서 데이터 시딩"""
-        try:
-            research_docs = [
-                {
-                    "title": f"Paper {i+1}", 
-                    "content": f"제조 공정 최적화 기술 문서 {i+1}: 공정 제어, 안전 규정, 예지 정비, 데이터 기반 분석.", 
-                    "metadata": "{}"
-                }
-                for i in range(10)
-            ]
-            
-            for doc in research_docs:
-                response = requests.post(
-                    f"{self._weaviate_url}/v1/objects",
-                    json={
-                        "class": self._class_research,
-                        "properties": doc
-                    },
-                    timeout=15,
-                )
-                if response.status_code not in [200, 201]:
-                    print(f"⚠️  문서 추가 실패: {response.status_code}")
-                    
+                self._known_classes.add(class_name)
+                return
         except Exception as e:
-            print(f"⚠️  데이터 시딩 실패: {str(e)}")
-
-    def _create_history_index(self) -> None:
-        """사용자 이력 인덱스 생성"""
-        try:
-            # 기존 클래스가 있는지 확인
-            existing_response = requests.get(f"{self._weaviate_url}/v1/schema/{self._class_history}")
-            if existing_response.status_code == 200:
-                print(f"✅ {self._class_history} 클래스 이미 존재")
+            logger.warning("스키마 확인 실패: %s", e)
+        
+        self._ensure_index_and_seed()
+    
+    def _ensure_index_and_seed(self) -> None:
+        """인덱스 생성 및 초기 데이터 시딩 (같은 Weaviate/클래스 접두사는 프로세스당 한 번)"""
+        if self._initialized:
+            return
+        
+        key = (self._weaviate_url, self._class_prefix)
+        with RAGSearchTool._init_locks_guard:
+            lock = RAGSearchTool._init_locks.setdefault(key, threading.Lock())
+        
+        with lock:
+            if key in RAGSearchTool._inited_keys:
+                self._initialized = True
                 return
+            
+            try:
+                # 세 도메인은 서로 독립적이므로 도메인별 (생성 → 시딩)을 동시에 처리
+                with ThreadPoolExecutor(max_workers=len(_DOMAINS)) as executor:
+                    domain_ok = list(executor.map(self._init_domain, _DOMAINS))
                 
-            response = requests.post(
-                f"{self._weaviate_url}/v1/schema",
-                json={
-                    "class": self._class_history,
-                    "description": "All users' past execution logs",
-                    "vectorizer": "text2vec-transformers",
-                    "moduleConfig": {
-                        "text2vec-transformers": {
-                            "vectorizeClassName": False,
-                            "poolingStrategy": "masked_mean",
-                            "vectorizePropertyName": False
-                        }
-                    },
-                    "properties": [
-                        {
-                            "name": "title",
-                            "dataType": ["text"],
-                            "description": "History title",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": False,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        },
-                        {
-                            "name": "content",
-                            "dataType": ["text"],
-                            "description": "History content",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": False,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        },
-                        {
-                            "name": "metadata",
-                            "dataType": ["text"],
-                            "description": "History metadata",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": True,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        }
-                    ]
-                },
-                timeout=10,
-            )
-            if response.status_code == 200:
-                print(f"✅ {self._class_history} 인덱스 생성 완료")
-        except Exception as e:
-            print(f"⚠️  인덱스 생성 실패: {str(e)}")
+                # 임베딩 검증 및 재생성
+                self._validate_and_regenerate_embeddings()
+            except Exception as e:
+                logger.warning("인덱스 초기화 실패: %s", e)
+                return
+            
+            # 한 도메인이라도 실패하면 완료로 표시하지 않음 - 다음 호출에서 실패한 도메인만 다시 시도
+            if all(domain_ok):
+                RAGSearchTool._inited_keys.add(key)
+                self._initialized = True
+            else:
+                logger.warning("일부 도메인 인덱스 초기화 실패 - 다음 호출에서 재시도")
 
-    def _seed_history_data(self) -> None:
-        """사용자 이력 데이터 시딩"""
-        try:
-            history_docs = [
-                {
-                    "title": f"History {i+1}", 
-                    "content": f"사용자 수행 내역 {i+1}: 압력 이상 대응, 점검 절차 수행, 원인 분석 리포트, 후속 조치 완료.", 
-                    "metadata": "{}"
-                }
-                for i in range(10)
-            ]
-            
-            for doc in history_docs:
-                response = requests.post(
-                    f"{self._weaviate_url}/v1/objects",
-                    json={
-                        "class": self._class_history,
-                        "properties": doc
-                    },
-                    timeout=15,
-                )
-                if response.status_code not in [200, 201]:
-                    print(f"⚠️  문서 추가 실패: {response.status_code}")
-                    
-        except Exception as e:
-            print(f"⚠️  데이터 시딩 실패: {str(e)}")
+    def _init_domain(self, domain: Tuple[str, str, str, Tuple[Dict[str, str], ...]]) -> bool:
+        """도메인 하나의 인덱스 생성 후 시딩 - 둘 다 성공(또는 이미 완료)하면 True"""
+        suffix, description, noun, seed_docs = domain
+        class_name = self._class_names[suffix.lower()]
+        seeded_key = (self._weaviate_url, class_name)
+        if seeded_key in RAGSearchTool._seeded_classes:
+            return True
+        if not self._create_index(class_name, description, noun):
+            return False
+        if not self._seed(class_name, seed_docs):
+            return False
+        RAGSearchTool._seeded_classes.add(seeded_key)
+        return True
 
-    def _create_compliance_index(self) -> None:
-        """규정 준수 인덱스 생성"""
+    def _create_index(self, class_name: str, description: str, noun: str) -> bool:
+        """도메인 인덱스(클래스) 생성 - 클래스가 이미 있거나 생성되면 True"""
         try:
             # 기존 클래스가 있는지 확인
-            existing_response = requests.get(f"{self._weaviate_url}/v1/schema/{self._class_compliance}")
+            existing_response = self._request("GET", f"/v1/schema/{class_name}")
             if existing_response.status_code == 200:
-                print(f"✅ {self._class_compliance} 클래스 이미 존재")
-                return
+                logger.info("%s 클래스 이미 존재", class_name)
+                return True
             
-            response = requests.post(
-                f"{self._weaviate_url}/v1/schema",
-                json={
-                    "class": self._class_compliance,
-                    "description": "Safety regulations and compliance guidelines",
-                    "vectorizer": "text2vec-transformers",
-                    "moduleConfig": {
-                        "text2vec-transformers": {
-                            "vectorizeClassName": False,
-                            "poolingStrategy": "masked_mean",
-                            "vectorizePropertyName": False
-                        }
-                    },
-                    "properties": [
-                        {
-                            "name": "title",
-                            "dataType": ["text"],
-                            "description": "Regulation title",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": False,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        },
-                        {
-                            "name": "content",
-                            "dataType": ["text"],
-                            "description": "Regulation content",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": False,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        },
-                        {
-                            "name": "metadata",
-                            "dataType": ["text"],
-                            "description": "Regulation metadata",
-                            "moduleConfig": {
-                                "text2vec-transformers": {
-                                    "skip": True,
-                                    "vectorizePropertyName": False
-                                }
-                            }
-                        }
-                    ]
-                },
+            response = self._request(
+                "POST",
+                "/v1/schema",
+                data=_SCHEMA_TEMPLATE.substitute(
+                    class_name=_json_text(class_name),
+                    description=_json_text(description),
+                    noun=_json_text(noun),
+                ).encode(),
                 timeout=10,
             )
             if response.status_code == 200:
-                print(f"✅ {self._class_compliance} 인덱스 생성 완료")
+                logger.info("%s 인덱스 생성 완료", class_name)
+                return True
+            logger.warning("인덱스 생성 실패: %s", response.status_code)
         except Exception as e:
-            print(f"⚠️  인덱스 생성 실패: {str(e)}")
+            logger.warning("인덱스 생성 실패: %s", e)
+        return False
 
-    def _seed_compliance_data(self) -> None:
-        """규정 준수 데이터 시딩"""
+    def _seed(self, class_name: str, docs: Tuple[Dict[str, str], ...]) -> bool:
+        """도메인 초기 데이터 시딩 - 모든 문서가 추가되면 True"""
         try:
-            compliance_docs = [
-                {
-                    "title": f"Regulation {i+1}", 
-                    "content": f"안전 규정 {i+1}: 개인보호구 착용, 작업 허가서 발급, 위험성 평가, 비상 대응 절차.", 
-                    "metadata": "{}"
-                }
-                for i in range(10)
-            ]
-            
-            for doc in compliance_docs:
-                response = requests.post(
-                    f"{self._weaviate_url}/v1/objects",
-                    json={
-                        "class": self._class_compliance,
-                        "properties": doc
-                    },
-                    timeout=15,
-                )
-                if response.status_code not in [200, 201]:
-                    print(f"⚠️  문서 추가 실패: {response.status_code}")
-                    
+            return self._batch_insert(class_name, docs) == len(docs)
         except Exception as e:
-            print(f"⚠️  데이터 시딩 실패: {str(e)}")
+            logger.warning("데이터 시딩 실패: %s", e)
+            return False
+
+    def _batch_insert(self, class_name: str, docs: Sequence[Dict[str, Any]]) -> int:
+        """문서들을 배치 API 한 번으로 추가 - 성공 개수 반환 (객체별 실패는 응답에서 확인)"""
+        response = self._request(
+            "POST",
+            "/v1/batch/objects",
+            json={"objects": [{"class": class_name, "properties": doc} for doc in docs]},
+            timeout=30,
+        )
+        if response.status_code not in [200, 201]:
+            logger.warning("문서 추가 실패: %s", response.status_code)
+            return 0
+        
+        success = 0
+        for obj_result in orjson.loads(response.content):
+            errors = (obj_result.get("result") or {}).get("errors")
+            if errors:
+                logger.warning("문서 추가 실패: %s", errors)
+            else:
+                success += 1
+        return success
 
     def _validate_and_regenerate_embeddings(self) -> None:
         """임베딩 검증 및 재생성"""
         try:
             # 각 클래스에서 샘플 문서의 벡터 확인
-            for class_name in [self._class_research, self._class_history, self._class_compliance]:
+            for class_name in self._class_names.values():
                 try:
                     # GraphQL로 첫 번째 객체의 벡터 확인
                     query = {
@@ -556,14 +780,15 @@ class RAGSearchTool(BaseTool):
                         '''
                     }
                     
-                    response = requests.post(
-                        f"{self._weaviate_url}/v1/graphql",
+                    response = self._request(
+                        "POST",
+                        "/v1/graphql",
                         json=query,
                         timeout=10
                     )
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = orjson.loads(response.content)
                         objects = data.get("data", {}).get("Get", {}).get(class_name, [])
                         
                         if objects:
@@ -571,41 +796,43 @@ class RAGSearchTool(BaseTool):
                             vector = obj.get("_additional", {}).get("vector")
                             
                             if vector and len(vector) > 0:
-                                print(f"✅ {class_name} 벡터화 확인 완료 (차원: {len(vector)})")
+                                logger.info("%s 벡터화 확인 완료 (차원: %s)", class_name, len(vector))
                             else:
-                                print(f"⚠️  {class_name} 벡터화 미완료 - 재처리 필요")
+                                logger.warning("%s 벡터화 미완료 - 재처리 필요", class_name)
                                 # 벡터 재생성 시도
                                 self._trigger_vectorization(class_name)
                         else:
-                            print(f"⚠️  {class_name}에 데이터 없음")
+                            logger.warning("%s에 데이터 없음", class_name)
                     else:
-                        print(f"⚠️  {class_name} 벡터 확인 실패: {response.status_code}")
+                        logger.warning("%s 벡터 확인 실패: %s", class_name, response.status_code)
                         
                 except Exception as e:
-                    print(f"⚠️  {class_name} 벡터 검증 중 오류: {str(e)}")
+                    logger.warning("%s 벡터 검증 중 오류: %s", class_name, e)
                     
         except Exception as e:
-            print(f"⚠️  전체 벡터 검증 실패: {str(e)}")
+            logger.warning("전체 벡터 검증 실패: %s", e)
 
     def _trigger_vectorization(self, class_name: str) -> None:
         """특정 클래스의 벡터화 다시 트리거"""
         try:
             # 모든 객체를 다시 읽어서 벡터화 트리거
-            response = requests.get(
-                f"{self._weaviate_url}/v1/objects",
+            response = self._request(
+                "GET",
+                "/v1/objects",
                 params={"class": class_name, "limit": 10},
                 timeout=10
             )
             
             if response.status_code == 200:
-                objects = response.json().get("objects", [])
+                objects = orjson.loads(response.content).get("objects", [])
                 for obj in objects:
                     obj_id = obj["id"]
                     properties = obj["properties"]
                     
                     # 객체 업데이트로 벡터화 다시 트리거
-                    update_response = requests.put(
-                        f"{self._weaviate_url}/v1/objects/{obj_id}",
+                    update_response = self._request(
+                        "PUT",
+                        f"/v1/objects/{obj_id}",
                         json={
                             "class": class_name,
                             "properties": properties
@@ -614,18 +841,21 @@ class RAGSearchTool(BaseTool):
                     )
                     
                     if update_response.status_code == 200:
-                        print(f"📝 {class_name} 객체 {obj_id[:8]}... 벡터화 재트리거")
+                        logger.info("%s 객체 %s... 벡터화 재트리거", class_name, obj_id[:8])
                     
         except Exception as e:
-            print(f"⚠️  {class_name} 벡터화 재트리거 실패: {str(e)}")
+            logger.warning("%s 벡터화 재트리거 실패: %s", class_name, e)
     
-    def upload_documents(self, documents: List[Dict[str, Any]], domain: str = "compliance") -> Dict[str, Any]:
+    def upload_documents(self, documents: List[Dict[str, Any]], domain: str = "compliance",
+                         wait_for_vectorization: bool = False) -> Dict[str, Any]:
         """
         문서를 특정 도메인에 업로드
         
         Args:
             documents: 업로드할 문서 리스트 (title, content, metadata 포함)
             domain: 업로드 대상 도메인 (research, history, compliance)
+            wait_for_vectorization: 업로드 후 벡터화 완료까지 확인할지 여부
+                (False면 확인을 생략하고 Weaviate 비동기 인덱싱에 맡김)
         
         Returns:
             업로드 결과 (성공 개수, 실패 개수 등)
@@ -640,6 +870,7 @@ class RAGSearchTool(BaseTool):
             success_count = 0
             failed_count = 0
             vectorized_count = 0
+            uploaded = {}  # object_id -> (title, properties), 벡터 확인은 업로드 후 일괄 처리
             
             for doc in documents:
                 try:
@@ -647,17 +878,17 @@ class RAGSearchTool(BaseTool):
                     properties = {
                         "title": doc.get("title", ""),
                         "content": doc.get("content", ""),
-                        "metadata": str(doc.get("metadata", {}))
+                        "metadata": _dump_metadata(doc.get("metadata"))
                     }
                     
                     # Weaviate에 문서 추가
-                    response = requests.post(
-                        f"{self._weaviate_url}/v1/objects",
+                    response = self._request(
+                        "POST",
+                        "/v1/objects",
                         json={
                             "class": class_name,
                             "properties": properties
                         },
-                        headers={"Content-Type": "application/json"},
                         timeout=15,
                     )
                     
@@ -665,26 +896,37 @@ class RAGSearchTool(BaseTool):
                         success_count += 1
                         
                         # 벡터화 확인
-                        response_data = response.json()
+                        response_data = orjson.loads(response.content)
                         object_id = response_data.get("id")
                         
-                        if object_id:
-                            # 생성된 객체의 벡터 확인
-                            if self._verify_document_vector(class_name, object_id):
-                                vectorized_count += 1
-                            else:
-                                print(f"⚠️  문서 '{doc.get('title', 'Unknown')}' 벡터화 실패 - 재시도")
-                                # 벡터화 재시도
-                                self._retry_vectorization(class_name, object_id, properties)
+                        if object_id and wait_for_vectorization:
+                            uploaded[object_id] = (doc.get('title', 'Unknown'), properties)
                     else:
                         failed_count += 1
-                        print(f"⚠️  문서 업로드 실패: {response.status_code} - {doc.get('title', 'Unknown')}")
+                        logger.warning("문서 업로드 실패: %s - %s", response.status_code, doc.get('title', 'Unknown'))
                         if response.text:
-                            print(f"    오류 상세: {response.text[:200]}")
+                            logger.warning("오류 상세: %s", response.text[:200])
                         
                 except Exception as e:
                     failed_count += 1
-                    print(f"⚠️  문서 업로드 중 오류: {str(e)} - {doc.get('title', 'Unknown')}")
+                    logger.warning("문서 업로드 중 오류: %s - %s", e, doc.get('title', 'Unknown'))
+            
+            if uploaded:
+                # 생성된 객체의 벡터를 일괄 확인하고, 누락된 문서만 모아서 재시도
+                verified = self._verify_vectors_batch(class_name, list(uploaded))
+                retry = {}
+                for object_id, (title, properties) in uploaded.items():
+                    if verified.get(object_id):
+                        vectorized_count += 1
+                    else:
+                        logger.warning("문서 '%s' 벡터화 실패 - 재시도", title)
+                        retry[object_id] = properties
+                if retry:
+                    self._retry_vectorization(class_name, retry)
+            
+            # 새 문서가 검색 결과에 반영되도록 캐시 무효화
+            if success_count:
+                self.clear_cache()
             
             result = {
                 "success": True,
@@ -692,16 +934,20 @@ class RAGSearchTool(BaseTool):
                 "class_name": class_name,
                 "total": len(documents),
                 "uploaded": success_count,
-                "vectorized": vectorized_count,
+                "vectorized": vectorized_count if wait_for_vectorization else None,
                 "failed": failed_count
             }
             
-            print(f"✅ 문서 업로드 완료: {success_count}/{len(documents)} 성공, {vectorized_count}개 벡터화 완료 ({domain} 도메인)")
+            if wait_for_vectorization:
+                logger.info("문서 업로드 완료: %s/%s 성공, %s개 벡터화 완료 (%s 도메인)",
+                            success_count, len(documents), vectorized_count, domain)
+            else:
+                logger.info("문서 업로드 완료: %s/%s 성공 (%s 도메인)", success_count, len(documents), domain)
             return result
             
         except Exception as e:
             error_msg = f"문서 업로드 실패: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             return {
                 "success": False,
                 "error": error_msg,
@@ -712,14 +958,23 @@ class RAGSearchTool(BaseTool):
                 "failed": len(documents)
             }
     
-    def batch_upload_documents(self, documents: List[Dict[str, Any]], domain: str = "compliance", batch_size: int = 100) -> Dict[str, Any]:
+    def batch_upload_documents(self, documents: List[Dict[str, Any]], domain: str = "compliance",
+                               batch_size: Optional[int] = None,
+                               wait_for_vectorization: bool = False,
+                               weaviate_urls: Optional[List[str]] = None,
+                               num_clients: Optional[int] = None) -> Dict[str, Any]:
         """
         배치로 대량 문서 업로드
         
         Args:
             documents: 업로드할 문서 리스트
             domain: 업로드 대상 도메인
-            batch_size: 배치 크기
+            batch_size: 시작 배치 크기 (REST 경로에서만 사용, 이후 응답 지연에 따라 자동 조정.
+                None이면 직전 업로드에서 조정된 크기 사용. gRPC 경로는 동적 배치)
+            wait_for_vectorization: 업로드 후 벡터화 완료까지 확인할지 여부
+            weaviate_urls: 멀티 노드 Weaviate 노드 URL 목록 (샤드별로 순환 배정)
+            num_clients: 동시 업로드 수 (기본값: weaviate_urls 개수, 없으면 1).
+                2 이상이면 문서를 라운드로빈으로 나눠 스레드별로 별도 연결에서 업로드
         
         Returns:
             업로드 결과
@@ -731,66 +986,28 @@ class RAGSearchTool(BaseTool):
             # 도메인별 클래스 선택
             class_name = self._get_class_name(domain)
             
-            total_success = 0
-            total_failed = 0
-            total_vectorized = 0
+            urls = weaviate_urls or [self._weaviate_url]
+            num_clients = min(num_clients or len(urls), len(documents))
             
-            # 배치 처리
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                batch_objects = []
-                
-                for doc in batch:
-                    batch_objects.append({
-                        "class": class_name,
-                        "properties": {
-                            "title": doc.get("title", ""),
-                            "content": doc.get("content", ""),
-                            "metadata": str(doc.get("metadata", {}))
-                        }
-                    })
-                
-                try:
-                    # Weaviate 배치 업로드
-                    response = requests.post(
-                        f"{self._weaviate_url}/v1/batch/objects",
-                        json={"objects": batch_objects},
-                        headers={"Content-Type": "application/json"},
-                        timeout=30,
-                    )
-                    
-                    if response.status_code in [200, 201]:
-                        response_data = response.json()
-                        
-                        # 각 객체의 업로드 결과 확인
-                        if isinstance(response_data, list):
-                            for obj_result in response_data:
-                                if obj_result.get("result", {}).get("status") == "SUCCESS":
-                                    total_success += 1
-                                    obj_id = obj_result.get("id")
-                                    if obj_id and self._verify_document_vector(class_name, obj_id):
-                                        total_vectorized += 1
-                                else:
-                                    total_failed += 1
-                        else:
-                            total_success += len(batch)
-                    else:
-                        total_failed += len(batch)
-                        print(f"⚠️  배치 업로드 실패: {response.status_code}")
-                        if response.text:
-                            print(f"    오류 상세: {response.text[:200]}")
-                        
-                except Exception as e:
-                    total_failed += len(batch)
-                    print(f"⚠️  배치 업로드 중 오류: {str(e)}")
-                
-                # 진행상황 출력
-                progress = ((i + len(batch)) / len(documents)) * 100
-                print(f"📊 업로드 진행: {progress:.1f}% ({i + len(batch)}/{len(documents)})")
-                
-                # 벡터화 대기
-                import time
-                time.sleep(0.5)  # 벡터화 처리를 위한 짧은 대기
+            # 샤드별 동시 업로드 (HTTP/gRPC 대기 위주라 스레드로 노드 수에 비례해 처리량 확장)
+            # v4 클라이언트(gRPC 배치)를 우선 사용하고, 사용할 수 없으면 REST 배치 API 사용
+            client = self._get_v4_client() if num_clients <= 1 else None
+            if num_clients > 1:
+                total_success, total_failed, total_vectorized = self._batch_upload_sharded(
+                    documents, domain, batch_size, wait_for_vectorization, urls, num_clients
+                )
+            elif client is not None:
+                total_success, total_failed, total_vectorized = self._batch_upload_grpc(
+                    client, documents, class_name, wait_for_vectorization
+                )
+            else:
+                total_success, total_failed, total_vectorized = self._batch_upload_rest(
+                    documents, class_name, batch_size, wait_for_vectorization
+                )
+            
+            # 새 문서가 검색 결과에 반영되도록 캐시 무효화
+            if total_success:
+                self.clear_cache()
             
             result = {
                 "success": True,
@@ -798,16 +1015,20 @@ class RAGSearchTool(BaseTool):
                 "class_name": class_name,
                 "total": len(documents),
                 "uploaded": total_success,
-                "vectorized": total_vectorized,
+                "vectorized": total_vectorized if wait_for_vectorization else None,
                 "failed": total_failed
             }
             
-            print(f"✅ 배치 업로드 완료: {total_success}/{len(documents)} 성공, {total_vectorized}개 벡터화 완료 ({domain} 도메인)")
+            if wait_for_vectorization:
+                logger.info("배치 업로드 완료: %s/%s 성공, %s개 벡터화 완료 (%s 도메인)",
+                            total_success, len(documents), total_vectorized, domain)
+            else:
+                logger.info("배치 업로드 완료: %s/%s 성공 (%s 도메인)", total_success, len(documents), domain)
             return result
             
         except Exception as e:
             error_msg = f"배치 업로드 실패: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             return {
                 "success": False,
                 "error": error_msg,
@@ -818,56 +1039,253 @@ class RAGSearchTool(BaseTool):
                 "failed": len(documents)
             }
     
-    def _verify_document_vector(self, class_name: str, object_id: str) -> bool:
-        """문서가 벡터화되었는지 확인"""
-        try:
-            response = requests.get(
-                f"{self._weaviate_url}/v1/objects/{class_name}/{object_id}",
-                params={"include": "vector"},
-                timeout=10
-            )
+    def _batch_upload_sharded(self, documents: List[Dict[str, Any]], domain: str, batch_size: Optional[int],
+                              wait_for_vectorization: bool, urls: List[str],
+                              num_clients: int) -> Tuple[int, int, int]:
+        """
+        문서를 라운드로빈으로 샤딩해 스레드별로 업로드 - (성공, 실패, 벡터화) 개수 반환
+        서버 프로세스 안에서도 호출되므로 fork하지 않음 (스레드/세션/gRPC 채널이 살아 있음)
+        """
+        shard_args = []
+        for k in range(num_clients):
+            tool_kwargs = {
+                "weaviate_url": urls[k % len(urls)],
+                "encoder_model": self._encoder,
+                "vector_dim": self._vector_dim,
+                "client_id": self._client_id,
+                "class_prefix": self._class_prefix,
+                "tool_type": self.tool_type,
+                "grpc_port": self._grpc_port,
+                "compress_requests": self._compress_requests,
+            }
+            shard_args.append((tool_kwargs, documents[k::num_clients], domain, batch_size, wait_for_vectorization))
+        
+        with ThreadPoolExecutor(max_workers=num_clients) as executor:
+            shard_results = list(executor.map(lambda args: _upload_shard(*args), shard_args))
+        
+        total_success = sum(r[0] for r in shard_results)
+        total_failed = sum(r[1] for r in shard_results)
+        total_vectorized = sum(r[2] for r in shard_results)
+        return total_success, total_failed, total_vectorized
+    
+    def _batch_upload_grpc(self, client, documents: List[Dict[str, Any]], class_name: str,
+                           wait_for_vectorization: bool) -> Tuple[int, int, int]:
+        """v4 클라이언트의 gRPC 배치로 업로드 - (성공, 실패, 벡터화) 개수 반환"""
+        object_ids = []
+        with client.batch.dynamic() as batch:
+            for doc in documents:
+                object_ids.append(batch.add_object(
+                    collection=class_name,
+                    properties={
+                        "title": doc.get("title", ""),
+                        "content": doc.get("content", ""),
+                        "metadata": _dump_metadata(doc.get("metadata"))
+                    }
+                ))
+        
+        failed_ids = {str(obj.object_.uuid) for obj in client.batch.failed_objects}
+        uploaded_ids = [str(obj_id) for obj_id in object_ids if str(obj_id) not in failed_ids]
+        for obj in client.batch.failed_objects[:5]:
+            logger.warning("배치 업로드 실패: %s", obj.message)
+        
+        vectorized = 0
+        if wait_for_vectorization:
+            vectorized = len(self._wait_for_vectors(class_name, uploaded_ids))
+        return len(uploaded_ids), len(failed_ids), vectorized
+    
+    def _batch_upload_rest(self, documents: List[Dict[str, Any]], class_name: str, batch_size: Optional[int],
+                           wait_for_vectorization: bool) -> Tuple[int, int, int]:
+        """REST 배치 API(/v1/batch/objects)로 업로드 - (성공, 실패, 벡터화) 개수 반환"""
+        total_success = 0
+        total_failed = 0
+        total_vectorized = 0
+        
+        if batch_size is not None:
+            self._current_batch = min(_MAX_BATCH_SIZE, max(_MIN_BATCH_SIZE, batch_size))
+        fast_batches = 0
+        
+        # 배치 처리 (배치마다 현재 크기만큼 잘라서 전송)
+        i = 0
+        while i < len(documents):
+            batch = documents[i:i + self._current_batch]
+            batch_objects = []
             
-            if response.status_code == 200:
-                data = response.json()
-                vector = data.get("vector")
-                return vector is not None and len(vector) > 0
+            for doc in batch:
+                batch_objects.append({
+                    "class": class_name,
+                    "properties": {
+                        "title": doc.get("title", ""),
+                        "content": doc.get("content", ""),
+                        "metadata": _dump_metadata(doc.get("metadata"))
+                    }
+                })
             
-            return False
+            succeeded = False
+            throttled = False
+            elapsed = 0.0
+            try:
+                # Weaviate 배치 업로드 (stream=True: 상태 코드를 먼저 보고 본문은 필요한 만큼만 읽음)
+                with self._request(
+                    "POST",
+                    "/v1/batch/objects",
+                    json={"objects": batch_objects},
+                    timeout=30,
+                    stream=True,
+                ) as response:
+                    elapsed = response.elapsed.total_seconds()
+                    throttled = elapsed > _SLOW_BATCH_SECONDS or response.status_code == 429 or response.status_code >= 500
+                    
+                    if response.status_code in [200, 201]:
+                        succeeded = True
+                        # 200이어도 객체별 오류가 본문에 담기므로 성공 응답은 본문을 파싱
+                        response_data = orjson.loads(response.content)
+                        
+                        # 각 객체의 업로드 결과 확인 (응답의 properties 등은 사용하지 않고 errors만 확인)
+                        if isinstance(response_data, list):
+                            batch_ids = []
+                            for obj_result in response_data:
+                                if not (obj_result.get("result") or {}).get("errors"):
+                                    total_success += 1
+                                    if obj_result.get("id"):
+                                        batch_ids.append(obj_result["id"])
+                                else:
+                                    total_failed += 1
+                            if wait_for_vectorization and batch_ids:
+                                total_vectorized += len(self._wait_for_vectors(class_name, batch_ids))
+                        else:
+                            total_success += len(batch)
+                    else:
+                        total_failed += len(batch)
+                        logger.warning("배치 업로드 실패: %s", response.status_code)
+                        # 실패 시 진단용으로 본문 앞부분만 읽음
+                        detail = response.raw.read(4096, decode_content=True)
+                        if detail:
+                            logger.warning("오류 상세: %s", detail[:200].decode('utf-8', errors='replace'))
+                    
+            except requests.exceptions.Timeout as e:
+                total_failed += len(batch)
+                throttled = True
+                logger.warning("배치 업로드 타임아웃: %s", e)
+            except Exception as e:
+                total_failed += len(batch)
+                logger.warning("배치 업로드 중 오류: %s", e)
             
-        except Exception as e:
-            print(f"⚠️  벡터 확인 중 오류: {str(e)}")
-            return False
-    
-    def _retry_vectorization(self, class_name: str, object_id: str, properties: Dict[str, Any]) -> bool:
-        """문서 벡터화 재시도"""
-        try:
-            # 문서 내용을 다시 업데이트하여 벡터화 트리거
-            response = requests.patch(
-                f"{self._weaviate_url}/v1/objects/{class_name}/{object_id}",
-                json={"properties": properties},
-                headers={"Content-Type": "application/json"},
-                timeout=15
-            )
+            i += len(batch)
             
-            if response.status_code == 204:
-                # 벡터화 완료 대기
-                import time
-                time.sleep(1)
+            # 진행상황 출력
+            progress = (i / len(documents)) * 100
+            logger.info("업로드 진행: %.1f%% (%s/%s)", progress, i, len(documents))
+            
+            # 배치 크기 조정
+            if throttled:
+                self._current_batch = max(_MIN_BATCH_SIZE, self._current_batch // 2)
+                fast_batches = 0
+                logger.info("배치 크기 축소: %s", self._current_batch)
+            elif succeeded and elapsed < _FAST_BATCH_SECONDS:
+                fast_batches += 1
+                if fast_batches >= _GROW_AFTER_FAST_BATCHES:
+                    self._current_batch = min(_MAX_BATCH_SIZE, self._current_batch * 2)
+                    fast_batches = 0
+            else:
+                fast_batches = 0
+        
+        return total_success, total_failed, total_vectorized
+    
+    def _verify_vectors_batch(self, class_name: str, ids: List[str]) -> Dict[str, bool]:
+        """여러 문서의 벡터화 여부를 GraphQL로 일괄 확인 (객체 본문은 가져오지 않음)"""
+        verified = {object_id: False for object_id in ids}
+        for start in range(0, len(ids), _VERIFY_BATCH_SIZE):
+            chunk = ids[start:start + _VERIFY_BATCH_SIZE]
+            graphql_query = {
+                "query": f'''
+                {{
+                    Get {{
+                        {class_name}(
+                            where: {{
+                                path: ["id"]
+                                operator: ContainsAny
+                                valueText: {orjson.dumps(chunk).decode()}
+                            }}
+                            limit: {len(chunk)}
+                        ) {{
+                            _additional {{
+                                id
+                                vector
+                            }}
+                        }}
+                    }}
+                }}
+                '''
+            }
+            try:
+                response = self._request("POST", "/v1/graphql", json=graphql_query, timeout=10)
+                if response.status_code != 200:
+                    logger.warning("벡터 확인 실패: %s", response.status_code)
+                    continue
                 
-                # 벡터 재확인
-                if self._verify_document_vector(class_name, object_id):
-                    print(f"✅ 벡터화 재시도 성공: {object_id[:8]}...")
-                    return True
+                data = orjson.loads(response.content)
+                if "errors" in data:
+                    logger.warning("벡터 확인 GraphQL 오류: %s", data['errors'])
+                    continue
+                
+                for item in data.get("data", {}).get("Get", {}).get(class_name) or []:
+                    additional = item.get("_additional") or {}
+                    if additional.get("id") in verified:
+                        verified[additional["id"]] = bool(additional.get("vector"))
+                        
+            except Exception as e:
+                logger.warning("벡터 확인 중 오류: %s", e)
+        
+        return verified
+    
+    def _verify_document_vector(self, class_name: str, object_id: str) -> bool:
+        """문서가 벡터화되었는지 확인"""
+        return self._verify_vectors_batch(class_name, [object_id])[object_id]
+    
+    def _wait_for_vectors(self, class_name: str, ids: List[str]) -> set:
+        """벡터화 완료 여부를 지수 백오프로 일괄 폴링 - 벡터화된 ID 집합 반환 (즉시 확인 후 대기)"""
+        done = set()
+        pending = list(ids)
+        for delay in (0.0,) + _VECTORIZATION_BACKOFF:
+            if not pending:
+                break
+            if delay:
+                time.sleep(delay)
+            verified = self._verify_vectors_batch(class_name, pending)
+            done.update(object_id for object_id, ok in verified.items() if ok)
+            pending = [object_id for object_id in pending if not verified[object_id]]
+        return done
+    
+    def _retry_vectorization(self, class_name: str, documents: Dict[str, Dict[str, Any]]) -> int:
+        """문서 벡터화 재시도 - {object_id: properties}를 업데이트한 뒤 벡터를 일괄 확인, 성공 개수 반환"""
+        patched = []
+        for object_id, properties in documents.items():
+            try:
+                # 문서 내용을 다시 업데이트하여 벡터화 트리거
+                response = self._request(
+                    "PATCH",
+                    f"/v1/objects/{class_name}/{object_id}",
+                    json={"properties": properties},
+                    timeout=15
+                )
+                if response.status_code == 204:
+                    patched.append(object_id)
                 else:
-                    print(f"⚠️  벡터화 재시도 실패: {object_id[:8]}...")
-                    return False
+                    logger.warning("문서 업데이트 실패: %s", response.status_code)
+            except Exception as e:
+                logger.warning("벡터화 재시도 중 오류: %s", e)
+        
+        if not patched:
+            return 0
+        
+        # 벡터 재확인 (50개 단위 GraphQL 일괄 조회 + 지수 백오프)
+        vectorized = self._wait_for_vectors(class_name, patched)
+        for object_id in patched:
+            if object_id in vectorized:
+                logger.info("벡터화 재시도 성공: %s...", object_id[:8])
             else:
-                print(f"⚠️  문서 업데이트 실패: {response.status_code}")
-                return False
-                
-        except Exception as e:
-            print(f"⚠️  벡터화 재시도 중 오류: {str(e)}")
-            return False
+                logger.warning("벡터화 재시도 실패: %s...", object_id[:8])
+        return len(vectorized)
     
     def check_document_exists(self, title: str, domain: str = "compliance") -> bool:
         """
@@ -903,20 +1321,20 @@ class RAGSearchTool(BaseTool):
                 '''
             }
             
-            response = requests.post(
-                f"{self._weaviate_url}/v1/graphql",
+            response = self._request(
+                "POST",
+                "/v1/graphql",
                 json=query,
-                headers={"Content-Type": "application/json"},
                 timeout=10,
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 results = data.get("data", {}).get("Get", {}).get(class_name, [])
                 return len(results) > 0
             
             return False
             
         except Exception as e:
-            print(f"⚠️  문서 존재 확인 실패: {str(e)}")
+            logger.warning("문서 존재 확인 실패: %s", e)
             return False 
\ No newline at end of file
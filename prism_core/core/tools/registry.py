@@ -1,4 +1,6 @@
-from typing import Dict, List, Optional
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
 from .base import BaseTool
 from .schemas import ToolInfo, ToolRegistrationRequest
 
@@ -8,6 +10,35 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, BaseTool] = {}
+        # Inverted index: keyword token -> names of tools mentioning it
+        self._keyword_index: Dict[str, Set[str]] = defaultdict(set)
+        self._tokens_for: Dict[str, Set[str]] = {}
+        # Cached ToolInfo list; version is bumped on every mutation
+        self._list_cache: Optional[List[ToolInfo]] = None
+        self._version = 0
+    
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever registered tools change."""
+        return self._version
+    
+    def _invalidate(self) -> None:
+        self._list_cache = None
+        self._version += 1
+    
+    @staticmethod
+    def _tokenize(text: str) -> Set[str]:
+        # Underscores split tokens so "database" matches a tool named "database_tool"
+        return set(re.findall(r"[^\W_]+", text.lower()))
+    
+    def _add(self, tool: BaseTool) -> None:
+        """Store a tool and index its name/description keywords."""
+        self._tools[tool.name] = tool
+        tokens = self._tokenize(tool.description + " " + tool.name) | {tool.name.lower()}
+        self._tokens_for[tool.name] = tokens
+        for token in tokens:
+            self._keyword_index[token].add(tool.name)
+        self._invalidate()
     
     def register_tool(self, tool: BaseTool) -> None:
         """
@@ -22,7 +53,7 @@ class ToolRegistry:
         if tool.name in self._tools:
             raise ValueError(f"Tool with name '{tool.name}' is already registered")
         
-        self._tools[tool.name] = tool
+        self._add(tool)
     
     def register_dynamic_tool(self, request: ToolRegistrationRequest, config: Dict = None) -> BaseTool:
         """
@@ -55,9 +86,11 @@ class ToolRegistry:
             tool_type=request.tool_type,
             config=config or {}
         )
+        # Tag at registration so lookups don't need DynamicTool
+        tool._is_dynamic = True
         
         # Register the tool
-        self._tools[request.name] = tool
+        self._add(tool)
         return tool
     
     def get_tool(self, name: str) -> Optional[BaseTool]:
@@ -79,15 +112,17 @@ class ToolRegistry:
         Returns:
             List of tool information
         """
-        return [
-            ToolInfo(
-                name=tool.name,
-                description=tool.description,
-                parameters_schema=tool.parameters_schema,
-                tool_type=tool.tool_type,
-            )
-            for tool in self._tools.values()
-        ]
+        if self._list_cache is None:
+            self._list_cache = [
+                ToolInfo(
+                    name=tool.name,
+                    description=tool.description,
+                    parameters_schema=tool.parameters_schema,
+                    tool_type=tool.tool_type,
+                )
+                for tool in self._tools.values()
+            ]
+        return list(self._list_cache)
     
     def delete_tool(self, name: str) -> bool:
         """
@@ -101,6 +136,13 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            for token in self._tokens_for.pop(name, ()):
+                names = self._keyword_index.get(token)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del self._keyword_index[token]
+            self._invalidate()
             return True
         return False
     
@@ -126,11 +168,11 @@ class ToolRegistry:
         }
         
         # Add additional info for dynamic tools
-        if isinstance(tool, DynamicTool):
+        if getattr(tool, "_is_dynamic", False):
             info.update({
                 "type": "dynamic",
                 "tool_type": tool.tool_type,
-                "config": tool.config
+                "config": dict(tool.config)
             })
         
         return info
@@ -140,22 +182,21 @@ class ToolRegistry:
         Get tools that might be relevant for a given query.
         This is a simple implementation - could be enhanced with ML/NLP.
         
+        Matching is on whole tokens: a query word matches a tool when it equals
+        one of the tool's name/description tokens (tool names are also split
+        on underscores). Partial words such as "data" for "database" do not match.
+        
         Args:
             query: User query
             
         Returns:
-            List of potentially relevant tools
+            List of potentially relevant tools, in registration order
         """
-        query_lower = query.lower()
-        relevant_tools = []
-        
-        # Simple keyword matching
-        for tool in self._tools.values():
-            tool_keywords = (tool.description.lower() + " " + tool.name.lower())
-            if any(word in tool_keywords for word in query_lower.split()):
-                relevant_tools.append(tool)
-        
-        return relevant_tools
+        # Inverted index lookup per query token, then keep registration order
+        names = set().union(*(self._keyword_index.get(word, ()) for word in self._tokenize(query)))
+        if not names:
+            return []
+        return [tool for name, tool in self._tools.items() if name in names]
     
     def update_tool_config(self, name: str, config: Dict) -> bool:
         """
@@ -169,8 +210,9 @@ class ToolRegistry:
             True if updated successfully, False if tool not found or not dynamic
         """
         tool = self._tools.get(name)
-        if not tool or not isinstance(tool, DynamicTool):
+        if not tool or not getattr(tool, "_is_dynamic", False):
             return False
         
         tool.config.update(config)
+        self._invalidate()
         return True 
\ No newline at end of file
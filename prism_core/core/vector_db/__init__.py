@@ -5,16 +5,33 @@ Weaviate 기반 Vector Database 유틸리티 모듈
 각 클라이언트에서 RAG 구현 시 일관된 인터페이스 제공
 """
 
-from .client import WeaviateClient
-from .schemas import DocumentSchema, SearchResult, IndexConfig
-from .encoder import EncoderManager
-from .api import VectorDBAPI
+import importlib
+
+from .schemas import DocumentSchema, SearchQuery, SearchResult, IndexConfig
+
+# torch/transformers/weaviate를 끌어오는 심볼은 처음 접근할 때 import합니다
+_LAZY_IMPORTS = {
+    "WeaviateClient": ".client",
+    "EncoderManager": ".encoder",
+    "VectorDBAPI": ".api",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "WeaviateClient",
     "DocumentSchema", 
+    "SearchQuery",
     "SearchResult",
     "IndexConfig",
     "EncoderManager",
     "VectorDBAPI"
-] 
\ No newline at end of file
+]
@@ -238,7 +238,7 @@ class VectorDBAPI:
                         execution_time_ms=(time.time() - start_time) * 1000
                     )
                 else:
-                    doc_ids = client.add_documents(class_name, documents)
+                    doc_ids = await client.add_documents_async(class_name, documents)
                     success_count = len([id for id in doc_ids if id is not None])
                     
                     execution_time = (time.time() - start_time) * 1000
@@ -393,7 +393,7 @@ class VectorDBAPI:
         @router.get("/encoders/recommended")
         async def get_recommended_encoders():
             """추천 인코더 모델 목록"""
-            return EncoderManager.get_recommended_models()
+            return {name: dict(info) for name, info in EncoderManager.get_recommended_models().items()}
         
         @router.post("/encoders/test", response_model=APIResponse)
         async def test_encoder(
@@ -6,7 +6,9 @@ Weaviate Vector Database와의 연결 및 기본 CRUD 작업을 담당
 
 import uuid
 import time
+import asyncio
 import logging
+import orjson
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timezone
 from urllib.parse import urlparse
@@ -17,6 +19,13 @@ try:
 except ImportError:
     raise ImportError("Weaviate client not installed. Run: pip install weaviate-client")
 
+try:
+    # REST 배치 업로드용 비동기 HTTP (없으면 add_documents_async는 동기 배치로 대체)
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 from .schemas import DocumentSchema, SearchQuery, SearchResult, IndexConfig, VectorDBStatus, BulkOperation
 from .encoder import EncoderManager
 
@@ -202,6 +211,28 @@ class WeaviateClient:
             logger.error(f"Failed to delete class {class_name}: {e}")
             return False
     
+    @staticmethod
+    def _document_properties(document: DocumentSchema) -> Dict[str, Any]:
+        """문서를 Weaviate 객체 속성으로 변환 (메타데이터는 기본 속성을 덮어쓰지 않음)"""
+        if document.created_at is None:
+            created_at = datetime.now(timezone.utc).isoformat()
+        elif document.created_at.tzinfo is None:
+            created_at = document.created_at.replace(tzinfo=timezone.utc).isoformat()
+        else:
+            created_at = document.created_at.isoformat()
+        
+        properties = {
+            "content": document.content,
+            "title": document.title,
+            "source": document.source,
+            "created_at": created_at
+        }
+        if document.metadata:
+            for key, value in document.metadata.items():
+                if key not in properties:
+                    properties[key] = value
+        return properties
+    
     def add_document(self, class_name: str, document: DocumentSchema) -> Optional[str]:
         """
         단일 문서 추가
@@ -226,21 +257,7 @@ class WeaviateClient:
                 vector = document.vector
             
             # 문서 데이터 준비
-            properties = {
-                "content": document.content,
-                "title": document.title,
-                "source": document.source,
-                "created_at": (
-                    (document.created_at.replace(tzinfo=timezone.utc).isoformat() if document.created_at.tzinfo is None else document.created_at.isoformat())
-                    if document.created_at else datetime.now(timezone.utc).isoformat()
-                )
-            }
-            
-            # 메타데이터 추가
-            if document.metadata:
-                for key, value in document.metadata.items():
-                    if key not in properties:
-                        properties[key] = value
+            properties = self._document_properties(document)
             
             # 문서 ID 생성 또는 사용
             doc_id = document.id or str(uuid.uuid4())
@@ -297,20 +314,7 @@ class WeaviateClient:
                             vector = document.vector
                         
                         # 문서 데이터 준비
-                        properties = {
-                            "content": document.content,
-                            "title": document.title,
-                            "source": document.source,
-                            "created_at": (
-                                (document.created_at.replace(tzinfo=timezone.utc).isoformat() if document.created_at and document.created_at.tzinfo is None else (document.created_at.isoformat() if document.created_at else datetime.now(timezone.utc).isoformat()))
-                            )
-                        }
-                        
-                        # 메타데이터 추가
-                        if document.metadata:
-                            for key, value in document.metadata.items():
-                                if key not in properties:
-                                    properties[key] = value
+                        properties = self._document_properties(document)
                         
                         # 문서 ID 생성 또는 사용
                         doc_id = document.id or str(uuid.uuid4())
@@ -336,6 +340,89 @@ class WeaviateClient:
             logger.error(f"Failed to add documents to {class_name}: {e}")
             return [None] * len(documents)
     
+    async def add_documents_async(
+        self,
+        class_name: str,
+        documents: List[DocumentSchema],
+        batch_size: int = 100
+    ) -> List[Optional[str]]:
+        """
+        REST 배치 엔드포인트(/v1/batch/objects)로 문서 추가
+        
+        batch_size개씩 나눈 요청을 하나의 aiohttp 세션에서 동시에 전송합니다.
+        
+        Args:
+            class_name: 클래스명
+            documents: 문서 리스트
+            batch_size: 요청 하나에 담을 문서 수
+            
+        Returns:
+            생성된 문서 ID 리스트 (실패한 문서는 None)
+        """
+        # is_connected는 Weaviate에 동기 HTTP 요청을 보내므로 스레드에서 확인
+        if not await asyncio.to_thread(self.is_connected):
+            raise ConnectionError("Not connected to Weaviate")
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.add_documents, class_name, documents)
+        if not documents:
+            return []
+        
+        # 벡터 생성 (인코더가 있으면 내용이 있는 문서만 인코딩하고 위치를 맞춤)
+        vectors: List[Optional[List[float]]] = [document.vector for document in documents]
+        if self.encoder:
+            indexed = [(i, document.content) for i, document in enumerate(documents) if document.content]
+            if indexed:
+                embeddings = await asyncio.to_thread(self.encoder.encode_texts, [content for _, content in indexed])
+                for (i, _), embedding in zip(indexed, embeddings.tolist()):
+                    vectors[i] = embedding
+        
+        doc_ids = [document.id or str(uuid.uuid4()) for document in documents]
+        objects = []
+        for document, doc_id, vector in zip(documents, doc_ids, vectors):
+            obj = {"class": class_name, "id": doc_id, "properties": self._document_properties(document)}
+            if vector is not None:
+                obj["vector"] = vector
+            objects.append(obj)
+        
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        async def post_chunk(session, start: int) -> List[Optional[str]]:
+            chunk_ids = doc_ids[start:start + batch_size]
+            try:
+                async with session.post(
+                    f"{self.url}/v1/batch/objects",
+                    # 메타데이터의 datetime/UUID 등도 직렬화되도록 orjson 사용 (그 외 타입은 str)
+                    data=orjson.dumps({"objects": objects[start:start + batch_size]}, default=str),
+                    headers=headers
+                ) as response:
+                    if response.status != 200:
+                        logger.error(f"Batch upload to {class_name} failed: HTTP {response.status}")
+                        return [None] * len(chunk_ids)
+                    items = await response.json()
+            except Exception as e:
+                logger.error(f"Batch upload to {class_name} failed: {e}")
+                return [None] * len(chunk_ids)
+            
+            failed = {
+                item.get("id") for item in items
+                if (item.get("result") or {}).get("errors")
+            }
+            return [doc_id if doc_id not in failed else None for doc_id in chunk_ids]
+        
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=4),
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as session:
+            chunks = await asyncio.gather(*(
+                post_chunk(session, start) for start in range(0, len(objects), batch_size)
+            ))
+        
+        results = [doc_id for chunk in chunks for doc_id in chunk]
+        logger.info(f"Added {len([r for r in results if r])} documents to {class_name}")
+        return results
+    
     def search(self, class_name: str, query: SearchQuery) -> List[SearchResult]:
         """
         유사도 검색 수행
@@ -6,8 +6,15 @@ Encoder Manager
 
 import os
 import torch
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any, Union
+import threading
+import weakref
+import functools
+from collections import OrderedDict
+from types import MappingProxyType
+from contextlib import nullcontext
+from typing import List, Optional, Dict, Any, Mapping, Union
 from transformers import AutoTokenizer, AutoModel
 import numpy as np
 from pathlib import Path
@@ -15,6 +22,23 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
+def _tokenize_single(tokenizer, text: str, max_length: int) -> Dict[str, torch.Tensor]:
+    """단일 텍스트 토크나이징 (CPU 텐서) - load_model에서 토크나이저별 lru_cache로 감싸 사용"""
+    return dict(tokenizer(
+        [text],
+        return_tensors="pt",
+        padding=True,
+        truncation=True,
+        max_length=max_length
+    ))
+
+
+def _release_model(device: str) -> None:
+    """GPU 캐시 반환 (weakref.finalize 콜백 - 모델 참조를 잡지 않아야 메모리가 실제로 풀림)"""
+    if device.startswith("cuda") and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
 class EncoderManager:
     """
     인코더 모델 관리자
@@ -22,7 +46,8 @@ class EncoderManager:
     HuggingFace 모델 또는 로컬 모델을 로드하고 텍스트를 벡터로 변환
     """
     
-    def __init__(self, model_path_or_id: str, device: Optional[str] = None, cache_dir: Optional[str] = None):
+    def __init__(self, model_path_or_id: str, device: Optional[str] = None, cache_dir: Optional[str] = None,
+                 quantize: bool = True, embedding_cache_dir: Optional[str] = None, int8_cache: bool = False):
         """
         인코더 초기화
         
@@ -30,20 +55,50 @@ class EncoderManager:
             model_path_or_id: 모델 경로 또는 HuggingFace 모델 ID
             device: 사용할 디바이스 ('cpu', 'cuda', 'auto')
             cache_dir: 모델 캐시 디렉토리
+            quantize: CPU에서 Linear 레이어를 int8 동적 양자화할지 여부 (False면 FP32 그대로)
+            embedding_cache_dir: 임베딩을 .npy로 저장할 디렉토리 (None이면 디스크 캐시 미사용)
+            int8_cache: 디스크 캐시에 임베딩을 int8 + 벡터별 scale로 저장할지 여부 (False면 FP32, 반환값은 항상 FP32)
         """
         self.model_path_or_id = model_path_or_id
         self.cache_dir = cache_dir
+        self.quantize = quantize
         self.device = self._setup_device(device)
+        self.int8_cache = int8_cache
+        
+        # 디스크 임베딩 캐시 - (모델, 디바이스/정밀도)별 하위 디렉토리에 텍스트 해시 단위로 저장
+        # int8 CPU / bf16·fp16 GPU / FP32 임베딩은 값이 조금씩 달라 서로 섞이지 않게 구분
+        self._disk_cache_dir: Optional[Path] = None
+        if embedding_cache_dir:
+            self._disk_cache_dir = (
+                Path(embedding_cache_dir) / f"{model_path_or_id.replace('/', '_')}__{self._precision_tag()}"
+            )
         
         self.tokenizer = None
         self.model = None
         self.vector_dimension = None
         self._is_loaded = False
+        # CUDA에서 사용할 반정밀도 타입 (CPU는 None = FP32)
+        self._infer_dtype: Optional[torch.dtype] = None
+        self._finalizer: Optional[weakref.finalize] = None
         
         # 기본 설정
         self.max_length = 512
         self.batch_size = 32
         
+        # 텍스트별 임베딩 LRU 캐시 - (normalize, 텍스트 해시) 기준, 값은 FP32 벡터
+        self._emb_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._cache_cap = 10000
+        # encode_texts는 asyncio.to_thread로 동시에 호출되므로 캐시 접근은 잠금으로 보호 (인코딩 중에는 잡지 않음)
+        self._emb_cache_lock = threading.Lock()
+        
+    def _precision_tag(self) -> str:
+        """임베딩 값에 영향을 주는 디바이스 종류와 가중치 정밀도 (load_model의 선택과 동일)"""
+        if self.device.startswith("cuda") and torch.cuda.is_available():
+            return "cuda-bf16" if torch.cuda.is_bf16_supported() else "cuda-fp16"
+        if self.device == "cpu" and self.quantize:
+            return "cpu-int8"
+        return f"{self.device.split(':')[0]}-fp32"
+    
     def _setup_device(self, device: Optional[str]) -> str:
         """디바이스 설정"""
         if device == "auto" or device is None:
@@ -55,6 +110,10 @@ class EncoderManager:
         try:
             logger.info(f"Loading encoder model: {self.model_path_or_id}")
             
+            # 재로드 시 이전 모델을 먼저 해제 (이전 finalizer가 남지 않도록)
+            if self._finalizer is not None:
+                self.unload()
+            
             # 토크나이저 로드
             self.tokenizer = AutoTokenizer.from_pretrained(
                 self.model_path_or_id,
@@ -73,12 +132,36 @@ class EncoderManager:
             self.model.to(self.device)
             self.model.eval()
             
-            # 벡터 차원 확인
-            with torch.no_grad():
-                dummy_input = self.tokenizer("test", return_tensors="pt", padding=True, truncation=True)
-                dummy_input = {k: v.to(self.device) for k, v in dummy_input.items()}
-                dummy_output = self.model(**dummy_input)
-                self.vector_dimension = dummy_output.last_hidden_state.shape[-1]
+            # 벡터 차원은 모델 설정에서 확인 (없을 때만 더미 추론)
+            self.vector_dimension = getattr(self.model.config, "hidden_size", None)
+            
+            # 단일 텍스트 토크나이징 결과 캐시 (반복되는 짧은 쿼리용)
+            # self가 아닌 토크나이저만 붙잡아 인스턴스와 순환 참조를 만들지 않음
+            self._tokenize_one = functools.lru_cache(maxsize=4096)(
+                functools.partial(_tokenize_single, self.tokenizer)
+            )
+            
+            # CUDA에서는 반정밀도 가중치 사용 (BF16 미지원 GPU는 FP16)
+            if self.device.startswith("cuda"):
+                self._infer_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                self.model = self.model.to(dtype=self._infer_dtype)
+            # CPU에서는 Linear 레이어를 int8 동적 양자화 (출력은 FP32 유지)
+            elif self.device == "cpu" and self.quantize:
+                self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+            
+            # GPU에서는 커널 융합을 위해 컴파일
+            if hasattr(torch, "compile") and self.device != "cpu":
+                self.model = torch.compile(self.model, mode="reduce-overhead", dynamic=True)
+            
+            if self.vector_dimension is None:
+                with torch.inference_mode(), self._autocast():
+                    dummy_input = self.tokenizer("test", return_tensors="pt", padding=True, truncation=True)
+                    dummy_input = {k: v.to(self.device) for k, v in dummy_input.items()}
+                    dummy_output = self.model(**dummy_input)
+                    self.vector_dimension = dummy_output.last_hidden_state.shape[-1]
+            
+            # 인스턴스가 수거되면 모델 해제 (__del__과 달리 순환 참조에서도 동작)
+            self._finalizer = weakref.finalize(self, _release_model, self.device)
             
             self._is_loaded = True
             logger.info(f"Model loaded successfully. Vector dimension: {self.vector_dimension}")
@@ -98,57 +181,180 @@ class EncoderManager:
         Returns:
             벡터 배열 (shape: [n_texts, vector_dim])
         """
-        if not self._is_loaded:
-            self.load_model()
-        
         if isinstance(texts, str):
             texts = [texts]
         
-        all_embeddings = []
+        # 캐시 조회 - 처음 보는 텍스트만 모델에 통과
+        keys = [(normalize, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        miss_indices = []
+        with self._emb_cache_lock:
+            for idx, key in enumerate(keys):
+                cached = self._emb_cache.get(key)
+                if cached is not None:
+                    self._emb_cache.move_to_end(key)
+                    results[idx] = cached
+                else:
+                    miss_indices.append(idx)
         
-        # 배치 처리
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i:i + self.batch_size]
-            batch_embeddings = self._encode_batch(batch_texts)
-            all_embeddings.append(batch_embeddings)
+        # 메모리 캐시에 없는 텍스트는 디스크 캐시 확인 (적중하면 메모리 캐시로 승격)
+        new_entries = []
+        if miss_indices and self._disk_cache_dir is not None:
+            remaining = []
+            for idx in miss_indices:
+                entry = self._load_cached_embedding(texts[idx], normalize)
+                if entry is None:
+                    remaining.append(idx)
+                else:
+                    embedding = self._from_cache_entry(entry, normalize)
+                    results[idx] = embedding
+                    new_entries.append((keys[idx], embedding))
+            miss_indices = remaining
         
-        # 결합
-        embeddings = np.vstack(all_embeddings)
+        if miss_indices:
+            # 모델은 실제로 인코딩할 텍스트가 있을 때만 로드
+            if not self._is_loaded:
+                self.load_model()
+            
+            # 길이순으로 정렬해 비슷한 길이끼리 배치 (패딩 낭비 감소) - 결과는 인덱스로 원래 순서에 배치
+            miss_indices.sort(key=lambda idx: len(texts[idx]))
+            miss_texts = [texts[idx] for idx in miss_indices]
+            all_embeddings = []
+            
+            # 배치 처리
+            for i in range(0, len(miss_texts), self.batch_size):
+                batch_texts = miss_texts[i:i + self.batch_size]
+                batch_embeddings = self._encode_batch(batch_texts)
+                all_embeddings.append(batch_embeddings)
+            
+            # 디바이스 위에서 결합/정규화 후 CPU로 한 번만 전송 (배치마다 동기화하지 않음)
+            embeddings = torch.cat(all_embeddings, dim=0)
+            if normalize:
+                embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=1)
+            embeddings = embeddings.cpu().numpy()
+            
+            # 원래 순서로 배치하고 캐시에 저장 (int8 양자화는 디스크 항목에만 적용)
+            for idx, embedding in zip(miss_indices, embeddings):
+                results[idx] = embedding
+                new_entries.append((keys[idx], embedding))
+                if self._disk_cache_dir is not None:
+                    self._store_cached_embedding(texts[idx], normalize, self._to_cache_entry(embedding))
         
-        # 정규화
-        if normalize:
-            embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        # 디스크 적중 승격분과 새 임베딩 모두 반영해 용량 초과 시 오래된 항목부터 제거
+        if new_entries:
+            with self._emb_cache_lock:
+                self._emb_cache.update(new_entries)
+                while len(self._emb_cache) > self._cache_cap:
+                    self._emb_cache.popitem(last=False)
         
-        return embeddings
+        return np.vstack(results)
+    
+    def clear_cache(self) -> None:
+        """임베딩 캐시 비우기 (디스크 캐시는 유지)"""
+        with self._emb_cache_lock:
+            self._emb_cache.clear()
     
-    def _encode_batch(self, texts: List[str]) -> np.ndarray:
-        """배치 단위로 텍스트 인코딩"""
+    def _to_cache_entry(self, embedding: np.ndarray):
+        """
+        디스크 캐시 저장 형식으로 변환
+        int8_cache면 (int8 벡터, float32 scale) - scale = max|v| / 127, FP32 대비 1/4 크기
+        """
+        embedding = np.asarray(embedding, dtype=np.float32)
+        if not self.int8_cache:
+            return embedding
+        max_abs = float(np.abs(embedding).max()) if embedding.size else 0.0
+        scale = np.float32(max_abs / 127.0 if max_abs > 0 else 1.0)
+        return np.round(embedding / scale).astype(np.int8), scale
+    
+    @staticmethod
+    def _from_cache_entry(entry, normalize: bool) -> np.ndarray:
+        """디스크 캐시 항목을 FP32 벡터로 복원 (int8 항목은 양자화 오차를 없애도록 다시 정규화)"""
+        if not isinstance(entry, tuple):
+            return entry
+        q, scale = entry
+        embedding = q.astype(np.float32) * scale
+        if normalize:
+            norm = np.linalg.norm(embedding)
+            if norm > 0:
+                embedding /= norm
+        return embedding
+    
+    def _disk_cache_path(self, text: str, normalize: bool) -> Path:
+        """디스크 캐시 파일 경로 - sha256(텍스트)와 정규화 여부로 구분 (int8은 .i8.npz)"""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        suffix = "i8.npz" if self.int8_cache else "npy"
+        return self._disk_cache_dir / f"{digest}_{'n' if normalize else 'r'}.{suffix}"
+    
+    def _load_cached_embedding(self, text: str, normalize: bool):
+        """디스크 캐시에서 캐시 항목 로드 (없거나 손상되면 None)"""
+        path = self._disk_cache_path(text, normalize)
         try:
-            # 토크나이징
-            inputs = self.tokenizer(
-                texts,
-                return_tensors="pt",
-                padding=True,
-                truncation=True,
-                max_length=self.max_length
-            )
+            if self.int8_cache:
+                with np.load(path) as data:
+                    return data["q"], np.float32(data["scale"])
+            return np.load(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding cache file {path}: {e}")
+            return None
+    
+    def _store_cached_embedding(self, text: str, normalize: bool, entry) -> None:
+        """캐시 항목을 디스크에 저장 (임시 파일에 쓴 뒤 교체해 부분 기록을 남기지 않음)"""
+        path = self._disk_cache_path(text, normalize)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                if isinstance(entry, tuple):
+                    np.savez(f, q=entry[0], scale=entry[1])
+                else:
+                    np.save(f, entry)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write embedding cache file {path}: {e}")
+    
+    def _encode_batch(self, texts: List[str]) -> torch.Tensor:
+        """배치 단위로 텍스트 인코딩 - 임베딩은 디바이스에 둔 채 FP32 텐서로 반환"""
+        try:
+            # 토크나이징 (단일 텍스트는 캐시 사용)
+            if len(texts) == 1:
+                inputs = self._tokenize_one(texts[0], self.max_length)
+            else:
+                inputs = self.tokenizer(
+                    texts,
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=self.max_length
+                )
             
             # 디바이스로 이동
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            if self.device.startswith("cuda"):
+                inputs = {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in inputs.items()}
+            else:
+                inputs = {k: v.to(self.device) for k, v in inputs.items()}
             
             # 모델 실행
-            with torch.no_grad():
+            with torch.inference_mode(), self._autocast():
                 outputs = self.model(**inputs)
                 
                 # 평균 풀링 (CLS 토큰 대신)
                 embeddings = self._mean_pooling(outputs, inputs['attention_mask'])
             
-            return embeddings.cpu().numpy()
+            # 이후 처리는 FP32로 유지
+            return embeddings.float()
             
         except Exception as e:
             logger.error(f"Error encoding batch: {e}")
             raise
     
+    def _autocast(self):
+        """CUDA 반정밀도 추론용 autocast 컨텍스트 (그 외에는 아무것도 하지 않음)"""
+        if self._infer_dtype is None:
+            return nullcontext()
+        return torch.autocast(device_type="cuda", dtype=self._infer_dtype)
+    
     def _mean_pooling(self, model_output, attention_mask):
         """평균 풀링 적용"""
         token_embeddings = model_output.last_hidden_state
@@ -163,6 +369,8 @@ class EncoderManager:
             "vector_dimension": self.vector_dimension,
             "max_length": self.max_length,
             "batch_size": self.batch_size,
+            "quantized": self.device == "cpu" and self.quantize,
+            "int8_cache": self.int8_cache,
             "is_loaded": self._is_loaded
         }
     
@@ -175,9 +383,10 @@ class EncoderManager:
         self.max_length = max(1, min(max_length, 512))
     
     @staticmethod
-    def get_recommended_models() -> Dict[str, Dict[str, Any]]:
-        """추천 모델 목록"""
-        return {
+    @functools.lru_cache(maxsize=1)
+    def get_recommended_models() -> Mapping[str, Mapping[str, Any]]:
+        """추천 모델 목록 (프로세스당 한 번 생성, 읽기 전용으로 공유)"""
+        models = {
             "multilingual-e5-base": {
                 "model_id": "intfloat/multilingual-e5-base",
                 "description": "다국어 지원 임베딩 모델",
@@ -207,15 +416,32 @@ class EncoderManager:
                 "use_case": "고품질 임베딩 (API 기반)"
             }
         }
+        return MappingProxyType({
+            name: MappingProxyType({**info, "languages": tuple(info["languages"])})
+            for name, info in models.items()
+        })
+    
+    def unload(self) -> None:
+        """모델과 토크나이저를 즉시 해제 (다시 사용하면 재로드)"""
+        self.model = None
+        self.tokenizer = None
+        # 캐시된 토큰 텐서와 토크나이저 참조를 즉시 해제
+        tokenize_one = getattr(self, "_tokenize_one", None)
+        if tokenize_one is not None:
+            tokenize_one.cache_clear()
+        self._tokenize_one = None
+        self._is_loaded = False
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
     
-    def __del__(self):
-        """리소스 정리"""
-        if hasattr(self, 'model') and self.model is not None:
-            del self.model
-        if hasattr(self, 'tokenizer') and self.tokenizer is not None:
-            del self.tokenizer
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
+    def __enter__(self) -> "EncoderManager":
+        if not self._is_loaded:
+            self.load_model()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.unload()
 
 
 class OpenAIEncoder:
@@ -225,6 +451,10 @@ class OpenAIEncoder:
     OpenAI의 text-embedding-ada-002 등을 사용
     """
     
+    # 요청 한 번에 보낼 수 있는 입력 개수 / 추정 토큰 수 한도
+    MAX_ITEMS = 2048
+    MAX_TOKENS = 250_000
+    
     def __init__(self, api_key: str, model: str = "text-embedding-ada-002"):
         """
         OpenAI 인코더 초기화
@@ -239,7 +469,8 @@ class OpenAIEncoder:
         
         try:
             import openai
-            self.client = openai.OpenAI(api_key=api_key)
+            # 속도 제한(429) 등은 클라이언트 내장 지수 백오프로 재시도
+            self.client = openai.OpenAI(api_key=api_key, max_retries=5)
         except ImportError:
             raise ImportError("OpenAI library not installed. Run: pip install openai")
     
@@ -249,15 +480,21 @@ class OpenAIEncoder:
             texts = [texts]
         
         try:
-            response = self.client.embeddings.create(
-                input=texts,
-                model=self.model
-            )
+            all_embeddings = []
+            for chunk in self._chunks(texts):
+                response = self.client.embeddings.create(
+                    input=chunk,
+                    model=self.model
+                )
+                all_embeddings.extend(data.embedding for data in sorted(response.data, key=lambda d: d.index))
             
-            embeddings = np.array([data.embedding for data in response.data])
+            embeddings = np.array(all_embeddings)
             
             if normalize:
-                embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+                # 행별 노름을 한 번에 계산하고 제자리 나눗셈 (중간 배열 할당 최소화)
+                norms = np.einsum('ij,ij->i', embeddings, embeddings)
+                np.sqrt(norms, out=norms)
+                embeddings /= norms[:, None]
             
             return embeddings
             
@@ -265,6 +502,20 @@ class OpenAIEncoder:
             logger.error(f"OpenAI encoding error: {e}")
             raise
     
+    def _chunks(self, texts: List[str]):
+        """입력 개수와 추정 토큰 수(문자 수 / 4) 한도를 넘지 않도록 텍스트를 나눔"""
+        start = 0
+        tokens = 0
+        for i, text in enumerate(texts):
+            estimated = len(text) // 4 + 1
+            if i > start and (i - start >= self.MAX_ITEMS or tokens + estimated > self.MAX_TOKENS):
+                yield texts[start:i]
+                start = i
+                tokens = 0
+            tokens += estimated
+        if start < len(texts):
+            yield texts[start:]
+    
     def get_model_info(self) -> Dict[str, Any]:
         """모델 정보 반환"""
         return {
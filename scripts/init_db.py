@@ -1,101 +1,416 @@
+import io
 import os
+import re
 import sys
 import csv
+import json
+import hashlib
+import struct
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
 import psycopg2
+from psycopg2 import sql
 from psycopg2.extras import DictCursor
 
 # Add the parent directory to the Python path to allow sibling imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from prism_core.core.env import get_db_url
+
 # --- Configuration ---
 # Set the path to your sample data directory relative to the project root
 SAMPLE_DATA_DIR = Path(__file__).parent.parent / "Industrial_DB_sample"
+# Fingerprints of CSVs already loaded, so warm re-runs skip them without touching the tables.
+# Kept outside the (tracked) data directory, one file per database URL.
+MANIFEST_DIR = Path.home() / ".cache" / "prism_core"
+
+# Load into UNLOGGED tables and leave them UNLOGGED (no WAL for the load or later writes).
+# Switching back to LOGGED would rewrite the whole table into WAL, undoing the saving.
+# Off by default: after a server crash PostgreSQL truncates UNLOGGED tables, and they are
+# not replicated; re-run this script to reload them.
+UNLOGGED_LOAD = os.getenv("INIT_DB_UNLOGGED", "").lower() in ("1", "true", "yes")
+
+# PostgreSQL binary COPY framing: signature + flags + header extension length
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+PGCOPY_TRAILER = struct.pack("!h", -1)
+PGCOPY_NULL = struct.pack("!i", -1)
+COPY_BUFFER_SIZE = 1 << 20
+
+# Binary timestamps are microseconds since 2000-01-01
+PG_EPOCH = datetime(2000, 1, 1)
+BIGINT_MIN, BIGINT_MAX = -(1 << 63), (1 << 63) - 1
+# Canonical integers only: int() would also take "007", " 12" and "1_000",
+# and zero-padded codes would lose their leading zeros as BIGINT
+BIGINT_PATTERN = re.compile(r"[+-]?(0|[1-9][0-9]*)")
+# Same rule for the integer part of doubles (float() takes "007.5", " 1.5", "1_0", "nan")
+DOUBLE_PATTERN = re.compile(r"[+-]?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+# Timestamps must start with a dashed date, so digit-only codes never parse as dates
+TIMESTAMP_PATTERN = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+
+def _parse_bigint(value: str) -> int:
+    if not BIGINT_PATTERN.fullmatch(value):
+        raise ValueError(value)
+    number = int(value)
+    if not BIGINT_MIN <= number <= BIGINT_MAX:
+        raise OverflowError(value)
+    return number
+
+
+def _parse_double(value: str) -> float:
+    if not DOUBLE_PATTERN.fullmatch(value):
+        raise ValueError(value)
+    if len(value.lstrip("+-")) > 15 and value.lstrip("+-").isdigit():
+        raise ValueError(value)  # long integer identifiers would lose precision as float
+    return float(value)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    if not TIMESTAMP_PATTERN.match(value):
+        raise ValueError(value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        raise ValueError(value)  # timezone-aware values stay TEXT
+    return parsed
+
+
+def _encode_timestamp(value: str) -> bytes:
+    delta = _parse_timestamp(value) - PG_EPOCH
+    return struct.pack("!q", (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+
+
+# Candidate column types, narrowest first, with their sample-value parsers
+TYPE_CANDIDATES = (
+    ("BIGINT", _parse_bigint),
+    ("DOUBLE PRECISION", _parse_double),
+    ("TIMESTAMP", _parse_timestamp),
+)
+
+# Binary field encoders keyed by format_type() of the target column; anything else is sent as text
+FIELD_ENCODERS = {
+    "bigint": lambda value: struct.pack("!q", int(value)),
+    "double precision": lambda value: struct.pack("!d", float(value)),
+    "timestamp without time zone": _encode_timestamp,
+}
+
+
+def _encode_text(value: str) -> bytes:
+    return value.encode('utf-8')
+
+
+def _parses(parse, value: str) -> bool:
+    try:
+        parse(value)
+        return True
+    except (ValueError, OverflowError):
+        return False
+
+
+def infer_column_types(rows, column_count: int) -> list:
+    """
+    Returns, per column, the narrowest type every non-empty value parses as (TEXT otherwise).
+    Every row is checked, so the binary COPY encoders never meet a value that doesn't fit.
+    """
+    remaining = [list(TYPE_CANDIDATES) for _ in range(column_count)]
+    seen = [False] * column_count
+    for row in rows:
+        for i, value in enumerate(row[:column_count]):
+            if value == "":
+                continue
+            seen[i] = True
+            if remaining[i]:
+                remaining[i] = [(pg_type, parse) for pg_type, parse in remaining[i] if _parses(parse, value)]
+    return [
+        candidates[0][0] if has_values and candidates else "TEXT"
+        for candidates, has_values in zip(remaining, seen)
+    ]
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks (keeps memory bounded)."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def csv_to_pgcopy(csv_path: Path, column_types=()):
+    """
+    Yields a CSV file (minus its header) encoded as PostgreSQL binary COPY data.
+    Fields are encoded per target column type (see FIELD_ENCODERS; text otherwise);
+    empty fields become NULL, matching COPY ... WITH CSV semantics for unquoted empty values.
+    """
+    encoders = [FIELD_ENCODERS.get(column_type, _encode_text) for column_type in column_types]
+    yield PGCOPY_HEADER
+    with open(csv_path, 'rb', buffering=COPY_BUFFER_SIZE) as raw:
+        if hasattr(os, "posix_fadvise"):
+            # Sequential read hint: lets the kernel read ahead aggressively
+            os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        f = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            parts = [struct.pack("!h", len(row))]
+            for i, value in enumerate(row):
+                if value == "":
+                    parts.append(PGCOPY_NULL)
+                else:
+                    data = encoders[i](value) if i < len(encoders) else _encode_text(value)
+                    parts.append(struct.pack("!i", len(data)))
+                    parts.append(data)
+            yield b"".join(parts)
+    yield PGCOPY_TRAILER
 
 def get_db_connection():
     """Establishes and returns a database connection."""
-    load_dotenv()
-    db_url = os.getenv("DATABASE_URL")
+    db_url = get_db_url()
     if not db_url:
         raise ConnectionError("DATABASE_URL environment variable not set.")
     return psycopg2.connect(db_url)
 
 def create_table_from_csv(cursor, table_name: str, csv_path: Path):
     """Dynamically creates a table based on a CSV file's header."""
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
         reader = csv.reader(f)
         header = next(reader)
         
-        # Naively infer column types as TEXT for simplicity. 
-        # A more advanced script could try to infer numeric, date types, etc.
-        columns = [f'"{col.lower()}" TEXT' for col in header]
+        # An existing table keeps its column types; skip the full-file type scan
+        cursor.execute("SELECT to_regclass(%s);", (sql.Identifier(table_name).as_string(cursor),))
+        if cursor.fetchone()[0] is not None:
+            print(f"  - Table '{table_name}' already exists.")
+            return
         
-        create_sql = f"""
-        CREATE TABLE IF NOT EXISTS "{table_name}" (
-            {', '.join(columns)}
-        );
-        """
+        # Infer BIGINT / DOUBLE PRECISION / TIMESTAMP / TEXT from every row of the file
+        types = infer_column_types(reader, len(header))
+        columns = sql.SQL(", ").join(
+            sql.SQL("{} {}").format(sql.Identifier(col.lower()), sql.SQL(col_type))
+            for col, col_type in zip(header, types)
+        )
+
+        create_sql = sql.SQL("CREATE TABLE IF NOT EXISTS {} ({});").format(
+            sql.Identifier(table_name), columns
+        )
         print(f"  - Executing CREATE TABLE for '{table_name}'...")
         cursor.execute(create_sql)
         print(f"  - Table '{table_name}' created or already exists.")
 
-def copy_data_from_csv(cursor, table_name: str, csv_path: Path):
-    """Efficiently copies data from a CSV file to the specified table."""
-    # Check if table is empty before copying
-    cursor.execute(f'SELECT COUNT(*) FROM "{table_name}";')
-    if cursor.fetchone()[0] > 0:
+def copy_data_from_csv(cursor, table_name: str, csv_path: Path, unlogged: bool = False) -> bool:
+    """
+    Efficiently copies data from a CSV file to the specified table.
+    With unlogged=True the table is switched to UNLOGGED before the COPY and left that way.
+    Returns False if the table already had rows and the COPY was skipped.
+    """
+    # Check if table is empty before copying (stops at the first row, no full scan)
+    table = sql.Identifier(table_name)
+    cursor.execute(sql.SQL("SELECT EXISTS (SELECT 1 FROM {} LIMIT 1);").format(table))
+    if cursor.fetchone()[0]:
         print(f"  - Table '{table_name}' already contains data. Skipping COPY.")
-        return
+        return False
+
+    # Encode fields for the table's actual column types (it may predate type inference)
+    cursor.execute(
+        """
+        SELECT format_type(atttypid, atttypmod)
+        FROM pg_attribute
+        WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+        ORDER BY attnum;
+        """,
+        (table.as_string(cursor),),
+    )
+    column_types = [row[0] for row in cursor.fetchall()]
 
     print(f"  - Copying data from '{csv_path.name}' to '{table_name}'...")
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        # Use COPY FROM for high performance, skipping the header row.
-        cursor.copy_expert(f"COPY \"{table_name}\" FROM STDIN WITH CSV HEADER", f)
+    # Binary COPY skips server-side CSV parsing; rows are framed in Python and streamed.
+    if unlogged:
+        cursor.execute(sql.SQL("ALTER TABLE {} SET UNLOGGED;").format(table))
+    # The stream already yields bytes, so psycopg2 forwards them without re-encoding
+    stream = io.BufferedReader(_ChunkStream(csv_to_pgcopy(csv_path, column_types)), buffer_size=COPY_BUFFER_SIZE)
+    cursor.copy_expert(
+        sql.SQL("COPY {} FROM STDIN WITH (FORMAT BINARY)").format(table).as_string(cursor),
+        stream,
+        size=COPY_BUFFER_SIZE,
+    )
     print(f"  - Data copy for '{table_name}' complete.")
+    return True
 
 
-def initialize_database():
+def _load_one(task):
     """
-    Scans a directory for CSV files, creates a corresponding table for each,
-    and populates it with the data from the CSV.
+    Loads a single CSV into its table on a dedicated connection.
+    Runs in a worker process; returns (table_name, copied, error message or None).
     """
-    if not SAMPLE_DATA_DIR.exists():
-        print(f"Error: Sample data directory not found at '{SAMPLE_DATA_DIR}'")
-        return
-
+    table_name, csv_path = task
     conn = None
     try:
         conn = get_db_connection()
-        print("✅ Database connected successfully.")
-        
         with conn.cursor() as cur:
-            csv_files = list(SAMPLE_DATA_DIR.glob("*.csv"))
-            print(f"Found {len(csv_files)} CSV files to process.")
+            # Bulk-load data is reproducible from the CSVs; don't wait on WAL flush
+            cur.execute("SET LOCAL synchronous_commit = off;")
+            print(f"\nProcessing file: '{csv_path.name}' -> Table: '{table_name}'")
+
+            # 1. Create table based on CSV header
+            create_table_from_csv(cur, table_name, csv_path)
 
-            for csv_file in csv_files:
-                # Sanitize the filename to use as a table name
-                table_name = csv_file.stem.lower()
-                print(f"\nProcessing file: '{csv_file.name}' -> Table: '{table_name}'")
-                
-                # 1. Create table based on CSV header
-                create_table_from_csv(cur, table_name, csv_file)
+            # 2. Copy data from CSV to the new table
+            copied = copy_data_from_csv(cur, table_name, csv_path, unlogged=UNLOGGED_LOAD)
 
-                # 2. Copy data from CSV to the new table
-                copy_data_from_csv(cur, table_name, csv_file)
+            # 3. Indexes/constraints, if ever added, belong here - after the load
 
         conn.commit()
-        print("\n✅ Database initialization complete.")
+        return table_name, copied, None
 
     except (Exception, psycopg2.Error) as error:
-        print(f"❌ An error occurred during database initialization: {error}")
         if conn:
             conn.rollback()
+        return table_name, False, str(error)
 
     finally:
         if conn:
             conn.close()
-            print("Database connection closed.")
+
+
+def file_digest(path: Path) -> str:
+    """Streams a file through blake2b (16-byte digest)."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_path() -> Path:
+    """Manifest file for the configured database (keyed by a hash of its URL)."""
+    db_key = hashlib.blake2b((get_db_url() or "").encode('utf-8'), digest_size=8).hexdigest()
+    return MANIFEST_DIR / f"init_db_manifest_{db_key}.json"
+
+
+def load_manifest() -> dict:
+    try:
+        with open(manifest_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict) -> None:
+    """Writes the manifest atomically (temp file + os.replace)."""
+    path = manifest_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as error:
+        print(f"⚠️  Could not write load manifest '{path}': {error}")
+
+
+def fingerprint(entry: os.DirEntry, previous: dict = None) -> dict:
+    """
+    (size, mtime, blake2b) of a CSV. The content hash is only recomputed when
+    size or mtime differ from the previous fingerprint.
+    """
+    stat = entry.stat()
+    if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+        return previous
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "blake2b": file_digest(Path(entry.path))}
+
+
+def get_existing_tables() -> set:
+    """Names of tables in the public schema (one catalog query)."""
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT tablename FROM pg_tables WHERE schemaname = 'public';")
+            return {row[0] for row in cur.fetchall()}
+    finally:
+        conn.close()
+
+
+def initialize_database():
+    """
+    Scans a directory for CSV files, creates a corresponding table for each,
+    and populates it with the data from the CSV.
+    """
+    if not SAMPLE_DATA_DIR.exists():
+        print(f"Error: Sample data directory not found at '{SAMPLE_DATA_DIR}'")
+        return
+
+    with os.scandir(SAMPLE_DATA_DIR) as entries:
+        csv_entries = sorted(
+            (entry for entry in entries if entry.is_file() and entry.name.endswith(".csv")),
+            key=lambda entry: entry.name,
+        )
+    print(f"Found {len(csv_entries)} CSV files to process.")
+    if not csv_entries:
+        return
+
+    # Skip files whose fingerprint matches the manifest and whose table still exists
+    manifest = load_manifest()
+    try:
+        existing_tables = get_existing_tables()
+    except (Exception, psycopg2.Error) as error:
+        print(f"❌ An error occurred during database initialization: {error}")
+        return
+    # Unchanged files keep their entry; others are recorded only once actually copied
+    new_manifest = {}
+    fingerprints = {}
+    tasks = []
+    for entry in csv_entries:
+        # Sanitize the filename to use as a table name
+        table_name = Path(entry.name).stem.lower()
+        previous = manifest.get(entry.name)
+        current = fingerprint(entry, previous)
+        if previous and previous.get("blake2b") == current["blake2b"] and table_name in existing_tables:
+            print(f"  - '{entry.name}' unchanged since last load. Skipping.")
+            new_manifest[entry.name] = current
+            continue
+        if previous and table_name in existing_tables:
+            # Still describes what the table holds if this load skips or fails
+            new_manifest[entry.name] = previous
+        fingerprints[table_name] = (entry.name, current)
+        tasks.append((table_name, Path(entry.path)))
+
+    if not tasks:
+        save_manifest(new_manifest)
+        print("\n✅ Database initialization complete (nothing to load).")
+        return
+
+    # One process (and connection) per CSV so COPY runs on several backends at once
+    max_workers = min(os.cpu_count() or 1, len(tasks))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_load_one, tasks))
+
+    failed = [(table_name, error) for table_name, _, error in results if error]
+    for table_name, error in failed:
+        print(f"❌ An error occurred while loading '{table_name}': {error}")
+
+    # Record only files whose data was actually copied in this run
+    for table_name, copied, _ in results:
+        if copied:
+            name, current = fingerprints[table_name]
+            new_manifest[name] = current
+    save_manifest(new_manifest)
+
+    if failed:
+        print(f"\n⚠️  Database initialization finished with {len(failed)} failed table(s).")
+    else:
+        print("\n✅ Database initialization complete.")
 
 
 if __name__ == "__main__":
@@ -1,19 +1,20 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 # Add the parent directory to the Python path to allow sibling imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from prism_core.core.data.postgresql import PostgreSQLDataStore
+from prism_core.core.env import get_db_url
+
+# Number of event lines written to stdout per write() call
+WRITE_CHUNK_LINES = 10000
 
 def verify_database_contents():
     """
     Connects to the database and fetches all records from the 'events' table.
     """
-    load_dotenv()
-
-    db_url = os.getenv("DATABASE_URL")
+    db_url = get_db_url()
     if not db_url:
         print("Error: DATABASE_URL environment variable not set.")
         sys.exit(1)
@@ -27,7 +28,7 @@ def verify_database_contents():
 
     try:
         print("\n--- Verifying 'events' table ---")
-        events = db.query("SELECT * FROM events ORDER BY id;")
+        events = db.query("SELECT * FROM events ORDER BY id;", binary=True)
         
         if not events:
             print("❌ Verification failed: The 'events' table is empty.")
@@ -35,8 +36,13 @@ def verify_database_contents():
             return
 
         print(f"✅ Verification successful. Found {len(events)} records:")
-        for event in events:
-            print(f" - ID: {event['id']}, Type: {event['event_type']}, Severity: {event['severity']}, Desc: {event['description']}")
+        # One write per chunk of lines instead of one print per row
+        for start in range(0, len(events), WRITE_CHUNK_LINES):
+            sys.stdout.write("".join(
+                f" - ID: {event['id']}, Type: {event['event_type']}, Severity: {event['severity']}, Desc: {event['description']}\n"
+                for event in events[start:start + WRITE_CHUNK_LINES]
+            ))
+        sys.stdout.flush()
             
     except Exception as e:
         print(f"An error occurred during verification: {e}")
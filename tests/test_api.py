@@ -5,10 +5,11 @@ from unittest.mock import Mock
 from main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """테스트 클라이언트 픽스처"""
-    return TestClient(app)
+    """테스트 클라이언트 픽스처 (세션 전체에서 하나의 인스턴스를 재사용)"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 def test_root_endpoint(client):
@@ -20,6 +21,17 @@ def test_root_endpoint(client):
     assert data["version"] == "0.1.0"
 
 
+def test_health_endpoint(client):
+    """상태 확인 엔드포인트 테스트 (GET/HEAD)"""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    
+    response = client.head("/health")
+    assert response.status_code == 200
+    assert response.content == b""
+
+
 def test_agents_list_endpoint(client):
     """에이전트 목록 조회 엔드포인트 테스트"""
     response = client.get("/api/agents")
@@ -42,4 +54,62 @@ def test_agent_registration(client):
     response_data = response.json()
     assert response_data["name"] == agent_data["name"]
     assert response_data["description"] == agent_data["description"]
-    assert response_data["role_prompt"] == agent_data["role_prompt"] 
\ No newline at end of file
+    assert response_data["role_prompt"] == agent_data["role_prompt"] 
+
+def _register_test_tool(client, name):
+    tool_data = {
+        "name": name,
+        "description": "테스트용 계산 Tool",
+        "parameters_schema": {"type": "object", "properties": {"expression": {"type": "string"}}},
+        "tool_type": "calculation"
+    }
+    response = client.post("/api/tools", json=tool_data)
+    assert response.status_code == 200
+
+
+def test_tools_list_etag(client):
+    """Tool 목록 ETag 테스트 (If-None-Match 일치 시 304, 등록/삭제 시 ETag 변경)"""
+    response = client.get("/api/tools")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    
+    response = client.get("/api/tools", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    
+    # 등록 후에는 ETag가 바뀌고 이전 ETag로는 전체 목록을 받음
+    _register_test_tool(client, "etag_test_tool")
+    response = client.get("/api/tools", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "etag_test_tool" in [tool["name"] for tool in response.json()]
+    registered_etag = response.headers["etag"]
+    assert registered_etag != etag
+    
+    # 삭제 후에도 ETag가 바뀜
+    response = client.delete("/api/tools/etag_test_tool")
+    assert response.status_code == 200
+    response = client.get("/api/tools", headers={"If-None-Match": registered_etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] not in (etag, registered_etag)
+    assert "etag_test_tool" not in [tool["name"] for tool in response.json()]
+
+
+def test_tool_info_cache_invalidation(client):
+    """Tool 상세 정보 캐시 테스트 (설정 변경/삭제 시 캐시된 응답을 재사용하지 않음)"""
+    _register_test_tool(client, "cache_test_tool")
+    
+    response = client.get("/api/tools/cache_test_tool")
+    assert response.status_code == 200
+    assert "timeout" not in response.json()["config"]
+    
+    response = client.put("/api/tools/cache_test_tool/config", json={"timeout": 5})
+    assert response.status_code == 200
+    response = client.get("/api/tools/cache_test_tool")
+    assert response.status_code == 200
+    assert response.json()["config"]["timeout"] == 5
+    
+    response = client.delete("/api/tools/cache_test_tool")
+    assert response.status_code == 200
+    response = client.get("/api/tools/cache_test_tool")
+    assert response.status_code == 404
@@ -0,0 +1,48 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from prism_core.core.vector_db.encoder import EncoderManager
+
+
+def _fake_encoder(**kwargs) -> EncoderManager:
+    """모델 없이 고정된 임의 벡터를 반환하는 인코더 (텍스트별로 결정적)"""
+    encoder = EncoderManager("test-model", device="cpu", **kwargs)
+    encoder._is_loaded = True
+
+    def encode_batch(texts):
+        rows = [np.random.default_rng(sum(text.encode("utf-8"))).normal(size=16) * 3.0 for text in texts]
+        return torch.tensor(np.array(rows), dtype=torch.float32)
+
+    encoder._encode_batch = encode_batch
+    return encoder
+
+
+def test_encode_texts_normalized_rows_are_unit_norm():
+    """normalize=True면 새로 인코딩한 벡터와 캐시 적중 벡터 모두 단위 노름"""
+    encoder = _fake_encoder()
+    texts = ["설비 온도 이상", "압력 센서 점검", "a"]
+
+    first = encoder.encode_texts(texts, normalize=True)
+    assert first.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, atol=1e-6)
+
+    second = encoder.encode_texts(texts, normalize=True)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_int8_disk_cache_returns_unit_norm_rows(tmp_path):
+    """int8 디스크 캐시에서 복원한 벡터도 단위 노름이며 원본과 거의 같음"""
+    texts = ["설비 온도 이상", "압력 센서 점검"]
+
+    writer = _fake_encoder(embedding_cache_dir=str(tmp_path), int8_cache=True)
+    original = writer.encode_texts(texts, normalize=True)
+
+    reader = _fake_encoder(embedding_cache_dir=str(tmp_path), int8_cache=True)
+    reader._encode_batch = None  # 디스크 캐시만으로 응답해야 함
+    restored = reader.encode_texts(texts, normalize=True)
+
+    np.testing.assert_allclose(np.linalg.norm(restored, axis=1), 1.0, atol=1e-6)
+    np.testing.assert_allclose(restored, original, atol=2e-2)
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from scripts.init_db import infer_column_types
+
+
+def test_zero_padded_codes_stay_text():
+    """앞자리 0이 있는 코드는 BIGINT/DOUBLE로 추론하지 않음 (COPY 후 0이 사라지지 않도록)"""
+    rows = [
+        ["007", "1", "0.5", "2024-01-01 00:00:00"],
+        ["010", "-2", "3", "2024-01-02"],
+        ["123", "3", "1e5", ""],
+    ]
+
+    assert infer_column_types(rows, 4) == ["TEXT", "BIGINT", "DOUBLE PRECISION", "TIMESTAMP"]
+
+
+@pytest.mark.parametrize("value", [" 12", "1_000", "+ 1", "007.5", "nan"])
+def test_non_canonical_numbers_stay_text(value):
+    """int()/float()/fromisoformat()이 받아들이지만 원문이 바뀌는 값은 TEXT"""
+    assert infer_column_types([[value]], 1) == ["TEXT"]
+
+
+def test_late_non_conforming_value_falls_back_to_text():
+    """파일 뒤쪽의 맞지 않는 값도 타입 추론에 반영"""
+    rows = [[str(i)] for i in range(5000)] + [["N/A"]]
+
+    assert infer_column_types(rows, 1) == ["TEXT"]
+
+
+def test_digit_only_dates_are_not_timestamps():
+    """숫자만 있는 날짜 코드는 TIMESTAMP로 추론하지 않음"""
+    assert infer_column_types([["20240101"], ["2024-01-02"]], 1) == ["TEXT"]
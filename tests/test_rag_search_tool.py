@@ -0,0 +1,125 @@
+import gzip
+
+import orjson
+
+from prism_core.core.tools.rag_search_tool import RAGSearchTool
+
+
+class _FakeResponse:
+    """Weaviate 응답 대신 상태 코드만 담는 응답"""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _recording_tool(statuses, **kwargs):
+    """보낸 요청을 기록하고 statuses 순서대로 응답하는 Tool"""
+    tool = RAGSearchTool(weaviate_url="http://weaviate.test", **kwargs)
+    sent = []
+    responses = iter(statuses)
+
+    def request(method, url, **request_kwargs):
+        sent.append(request_kwargs)
+        return _FakeResponse(next(responses))
+
+    tool._http.request = request
+    return tool, sent
+
+
+def _large_payload():
+    return {"objects": [{"class": "Test", "properties": {"content": "x" * 100}} for _ in range(64)]}
+
+
+def test_request_body_is_not_compressed_by_default():
+    """기본값에서는 큰 본문도 압축하지 않음"""
+    tool, sent = _recording_tool([200])
+    payload = _large_payload()
+
+    tool._request("POST", "/v1/batch/objects", json=payload)
+
+    assert len(sent) == 1
+    assert "Content-Encoding" not in sent[0]["headers"]
+    assert sent[0]["data"] == orjson.dumps(payload)
+
+
+def test_request_body_is_gzipped_when_enabled():
+    """compress_requests=True면 큰 본문을 gzip으로 보내고 헤더를 붙임"""
+    tool, sent = _recording_tool([200], compress_requests=True)
+    payload = _large_payload()
+
+    tool._request("POST", "/v1/batch/objects", json=payload)
+
+    assert len(sent) == 1
+    assert sent[0]["headers"]["Content-Encoding"] == "gzip"
+    assert gzip.decompress(sent[0]["data"]) == orjson.dumps(payload)
+
+
+def test_small_body_is_not_compressed_when_enabled():
+    """압축을 켜도 작은 본문은 그대로 보냄"""
+    tool, sent = _recording_tool([200], compress_requests=True)
+
+    tool._request("POST", "/v1/batch/objects", json={"objects": []})
+
+    assert "Content-Encoding" not in sent[0]["headers"]
+    assert sent[0]["data"] == orjson.dumps({"objects": []})
+
+
+def test_rejected_gzip_body_is_resent_uncompressed():
+    """서버가 gzip 본문을 415로 거부하면 압축 없이 재전송하고 이후에도 압축하지 않음"""
+    tool, sent = _recording_tool([415, 200, 200], compress_requests=True)
+    payload = _large_payload()
+
+    response = tool._request("POST", "/v1/batch/objects", json=payload)
+
+    assert response.status_code == 200
+    assert len(sent) == 2
+    assert sent[0]["headers"]["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in sent[1]["headers"]
+    assert sent[1]["data"] == orjson.dumps(payload)
+
+    tool._request("POST", "/v1/batch/objects", json=payload)
+    assert "Content-Encoding" not in sent[2]["headers"]
+
+
+def test_failed_index_init_is_retried_on_next_call():
+    """도메인 초기화가 실패하면 완료로 표시하지 않고, 다음 호출에서 실패한 도메인만 다시 시도"""
+    tool = RAGSearchTool(weaviate_url="http://init-retry.test", class_prefix="Retry")
+    created = []
+    seeded = []
+    fail_once = {"RetryHistory"}
+
+    def create_index(class_name, description, noun):
+        created.append(class_name)
+        if class_name in fail_once:
+            fail_once.discard(class_name)
+            return False
+        return True
+
+    def seed(class_name, docs):
+        seeded.append(class_name)
+        return True
+
+    tool._create_index = create_index
+    tool._seed = seed
+    tool._validate_and_regenerate_embeddings = lambda: None
+
+    tool._ensure_index_and_seed()
+    assert not tool._initialized
+    assert ("http://init-retry.test", "Retry") not in RAGSearchTool._inited_keys
+    assert sorted(seeded) == ["RetryCompliance", "RetryResearch"]
+
+    # 다른 인스턴스도 초기화를 다시 시도하며, 이미 시딩된 도메인은 건너뜀
+    other = RAGSearchTool(weaviate_url="http://init-retry.test", class_prefix="Retry")
+    other._create_index = create_index
+    other._seed = seed
+    other._validate_and_regenerate_embeddings = lambda: None
+
+    other._ensure_index_and_seed()
+    assert other._initialized
+    assert ("http://init-retry.test", "Retry") in RAGSearchTool._inited_keys
+    assert created.count("RetryHistory") == 2
+    assert sorted(seeded) == ["RetryCompliance", "RetryHistory", "RetryResearch"]
@@ -0,0 +1,102 @@
+from prism_core.core.tools.base import BaseTool
+from prism_core.core.tools.registry import ToolRegistry
+from prism_core.core.tools.schemas import ToolRegistrationRequest, ToolResponse
+
+
+class _EchoTool(BaseTool):
+    """테스트용 Tool (실행 결과는 사용하지 않음)"""
+
+    def __init__(self, name: str, description: str):
+        super().__init__(name, description, {"type": "object", "properties": {}}, "function")
+
+    async def execute(self, request):
+        return ToolResponse(success=True, result={})
+
+
+def _registry(*tools) -> ToolRegistry:
+    registry = ToolRegistry()
+    for name, description in tools:
+        registry.register_tool(_EchoTool(name, description))
+    return registry
+
+
+def test_get_tools_for_query_keeps_registration_order():
+    """여러 Tool이 매칭되면 등록 순서대로 반환"""
+    registry = _registry(
+        ("zeta_tool", "센서 데이터 조회"),
+        ("alpha_tool", "센서 상태 분석"),
+        ("math_calculator", "수학 계산"),
+    )
+
+    for _ in range(5):
+        names = [tool.name for tool in registry.get_tools_for_query("센서 값을 알려줘")]
+        assert names == ["zeta_tool", "alpha_tool"]
+
+
+def test_get_tools_for_query_matches_whole_tokens():
+    """질의 단어가 Tool 이름/설명 토큰과 일치해야 매칭 (이름은 밑줄로도 분리)"""
+    registry = _registry(
+        ("database_tool", "Query the industrial database"),
+        ("math_calculator", "수학 계산"),
+    )
+
+    assert [tool.name for tool in registry.get_tools_for_query("database")] == ["database_tool"]
+    assert [tool.name for tool in registry.get_tools_for_query("database_tool")] == ["database_tool"]
+    assert [tool.name for tool in registry.get_tools_for_query("계산")] == ["math_calculator"]
+    assert registry.get_tools_for_query("data") == []
+    assert registry.get_tools_for_query("weather") == []
+
+
+def test_get_tools_for_query_after_delete():
+    """삭제된 Tool은 더 이상 매칭되지 않음"""
+    registry = _registry(("database_tool", "Query the industrial database"))
+
+    assert registry.delete_tool("database_tool")
+    assert registry.get_tools_for_query("database") == []
+
+
+def test_mutations_bump_version_and_rebuild_list_cache():
+    """등록/동적 등록/설정 변경/삭제 시 version이 증가하고 Tool 목록이 다시 만들어짐"""
+    registry = ToolRegistry()
+    version = registry.version
+    assert registry.list_tools() == []
+
+    registry.register_tool(_EchoTool("echo_tool", "테스트 Tool"))
+    assert registry.version > version
+    version = registry.version
+    assert [info.name for info in registry.list_tools()] == ["echo_tool"]
+
+    # 변경이 없으면 캐시를 재사용하고 version도 그대로
+    assert registry.list_tools() == registry.list_tools()
+    assert registry.version == version
+
+    registry.register_dynamic_tool(ToolRegistrationRequest(
+        name="calc_tool",
+        description="계산 Tool",
+        parameters_schema={"type": "object", "properties": {}},
+        tool_type="calculation",
+    ))
+    assert registry.version > version
+    version = registry.version
+    assert [info.name for info in registry.list_tools()] == ["echo_tool", "calc_tool"]
+
+    assert registry.update_tool_config("calc_tool", {"precision": 2})
+    assert registry.version > version
+    version = registry.version
+
+    # 실패한 변경은 version을 올리지 않음
+    assert not registry.update_tool_config("echo_tool", {"precision": 2})
+    assert not registry.delete_tool("missing_tool")
+    assert registry.version == version
+
+    assert registry.delete_tool("echo_tool")
+    assert registry.version > version
+    assert [info.name for info in registry.list_tools()] == ["calc_tool"]
+
+
+def test_list_tools_returns_a_copy():
+    """반환된 목록을 수정해도 캐시에는 영향 없음"""
+    registry = _registry(("echo_tool", "테스트 Tool"))
+
+    registry.list_tools().clear()
+    assert [info.name for info in registry.list_tools()] == ["echo_tool"]
@@ -6,154 +6,133 @@ Tool System Demo Script
 Client에서 tool을 등록하고, agent에 할당하여 자동으로 사용하는 예제입니다.
 """
 
-import requests
+import asyncio
+import logging
+from types import MappingProxyType
+import aiohttp
+import orjson
 import json
+import shelve
+import dbm
+import pickle
 import sys
+import time
+from pathlib import Path
+
+from demo_logging import setup_logging
+
+logger = logging.getLogger(__name__)
 
 # API 서버 설정
-BASE_URL = "http://localhost:8000/api"
+SERVER_URL = "http://localhost:8000"
+# 세션의 base_url이 SERVER_URL이므로 요청에는 경로만 사용합니다
+API_PREFIX = "/api"
+JSON_HEADERS = {"Content-Type": "application/json"}
+# 서버 상태 확인은 짧은 타임아웃으로 빠르게 실패
+HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=0.5)
+# Agent 호출은 LLM 생성 시간이 길어 전체 타임아웃 없이 대기 (연결만 제한)
+INVOKE_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10)
+# 마지막으로 성공한 Tool 목록 캐시 (서버 5xx 시 대체 사용, 최대 1일)
+# 손상되었거나 호환되지 않는 캐시 파일(dbm.error), 오래된 항목(pickle 오류)은 캐시 없음으로 처리
+TOOLS_CACHE_ERRORS = (OSError, *dbm.error, pickle.UnpicklingError)
+TOOLS_CACHE_PATH = Path.home() / ".cache" / "prism_demo" / "tools"
+TOOLS_CACHE_MAX_AGE = 24 * 60 * 60
 
-def main():
-    print("🚀 PRISM Core Tool System Demo")
-    print("=" * 50)
-    
-    try:
-        # 1. 서버 상태 확인
-        print("1. 서버 상태 확인...")
-        response = requests.get("http://localhost:8000/")
-        if response.status_code == 200:
-            print(f"✅ 서버 연결 성공: {response.json()}")
-        else:
-            print(f"❌ 서버 연결 실패: {response.status_code}")
-            return
-        
-        # 2. 등록된 Tool 목록 조회
-        print("\n2. 등록된 Tool 목록 조회...")
-        response = requests.get(f"{BASE_URL}/tools")
-        if response.status_code == 200:
-            tools = response.json()
-            print(f"✅ 등록된 Tool 수: {len(tools)}")
-            for tool in tools:
-                print(f"   - {tool['name']}: {tool['description']}")
-        else:
-            print(f"❌ Tool 목록 조회 실패: {response.status_code}")
-            return
-        
-        # 3. Client에서 새로운 Tool 등록
-        print("\n3. Client에서 새로운 Tool 등록...")
-        
-        # 3.1. API Tool 등록
-        api_tool_data = {
-            "name": "weather_api_tool",
-            "description": "Get weather information from external API",
-            "parameters_schema": {
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "API URL to call"
-                    },
-                    "method": {
-                        "type": "string",
-                        "default": "GET",
-                        "description": "HTTP method"
-                    },
-                    "data": {
-                        "type": "object",
-                        "description": "Request data"
-                    }
-                },
-                "required": []
+# Tool 등록 / Agent 등록 payload (읽기 전용 상수)
+# 3.1. API Tool 등록
+API_TOOL_DATA = MappingProxyType({
+    "name": "weather_api_tool",
+    "description": "Get weather information from external API",
+    "parameters_schema": {
+        "type": "object",
+        "properties": {
+            "url": {
+                "type": "string",
+                "description": "API URL to call"
             },
-            "tool_type": "api"
-        }
-        
-        response = requests.post(f"{BASE_URL}/tools/register", json=api_tool_data)
-        if response.status_code == 200:
-            print(f"✅ API Tool 등록 성공: {response.json()['message']}")
-        else:
-            print(f"❌ API Tool 등록 실패: {response.status_code}, {response.text}")
-        
-        # 3.2. Calculation Tool 등록
-        calc_tool_data = {
-            "name": "math_calculator",
-            "description": "Perform mathematical calculations safely",
-            "parameters_schema": {
+            "method": {
+                "type": "string",
+                "default": "GET",
+                "description": "HTTP method"
+            },
+            "data": {
                 "type": "object",
-                "properties": {
-                    "expression": {
-                        "type": "string",
-                        "description": "Mathematical expression to evaluate"
-                    },
-                    "variables": {
-                        "type": "object",
-                        "description": "Variables to use in the expression"
-                    }
-                },
-                "required": ["expression"]
+                "description": "Request data"
+            }
+        },
+        "required": []
+    },
+    "tool_type": "api"
+})
+
+# 3.2. Calculation Tool 등록
+CALC_TOOL_DATA = MappingProxyType({
+    "name": "math_calculator",
+    "description": "Perform mathematical calculations safely",
+    "parameters_schema": {
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression to evaluate"
             },
-            "tool_type": "calculation"
-        }
-        
-        response = requests.post(f"{BASE_URL}/tools/register", json=calc_tool_data)
-        if response.status_code == 200:
-            print(f"✅ Calculation Tool 등록 성공: {response.json()['message']}")
-        else:
-            print(f"❌ Calculation Tool 등록 실패: {response.status_code}, {response.text}")
-        
-        # 3.3. Custom Tool 등록
-        custom_tool_data = {
-            "name": "text_processor",
-            "description": "Process and transform text data",
-            "parameters_schema": {
+            "variables": {
                 "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": ["echo", "transform"],
-                        "description": "Action to perform"
-                    },
-                    "message": {
-                        "type": "string",
-                        "description": "Message for echo action"
-                    },
-                    "data": {
-                        "type": "object",
-                        "description": "Data for transform action"
-                    }
-                },
-                "required": ["action"]
+                "description": "Variables to use in the expression"
+            }
+        },
+        "required": ["expression"]
+    },
+    "tool_type": "calculation"
+})
+
+# 3.3. Custom Tool 등록
+CUSTOM_TOOL_DATA = MappingProxyType({
+    "name": "text_processor",
+    "description": "Process and transform text data",
+    "parameters_schema": {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["echo", "transform"],
+                "description": "Action to perform"
             },
-            "tool_type": "custom"
-        }
-        
-        response = requests.post(f"{BASE_URL}/tools/register", json=custom_tool_data)
-        if response.status_code == 200:
-            print(f"✅ Custom Tool 등록 성공: {response.json()['message']}")
-        else:
-            print(f"❌ Custom Tool 등록 실패: {response.status_code}, {response.text}")
-        
-        # 3.4. 사용자 정의 함수를 포함한 Custom Tool 등록
-        custom_function_tool_data = {
-            "name": "data_analyzer",
-            "description": "Analyze data using custom user-defined functions",
-            "parameters_schema": {
+            "message": {
+                "type": "string",
+                "description": "Message for echo action"
+            },
+            "data": {
                 "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": ["execute_function"],
-                        "description": "Action to perform"
-                    },
-                    "function_params": {
-                        "type": "object",
-                        "description": "Parameters to pass to the custom function"
-                    }
-                },
-                "required": ["action"]
+                "description": "Data for transform action"
+            }
+        },
+        "required": ["action"]
+    },
+    "tool_type": "custom"
+})
+
+# 3.4. 사용자 정의 함수를 포함한 Custom Tool 등록
+CUSTOM_FUNCTION_TOOL_DATA = MappingProxyType({
+    "name": "data_analyzer",
+    "description": "Analyze data using custom user-defined functions",
+    "parameters_schema": {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["execute_function"],
+                "description": "Action to perform"
             },
-            "tool_type": "custom",
-            "function_code": """
+            "function_params": {
+                "type": "object",
+                "description": "Parameters to pass to the custom function"
+            }
+        },
+        "required": ["action"]
+    },
+    "tool_type": "custom",
+    "function_code": """
 def main():
     # 사용자 정의 함수 예제
     import math
@@ -184,28 +163,173 @@ def main():
         "message": "Data analysis completed successfully"
     }
 """
-        }
+})
+
+# 6. 다중 Tool Agent
+AGENT_DATA = MappingProxyType({
+    "name": "multi_tool_analyst",
+    "description": "다양한 도구를 활용하는 분석 전문가",
+    "role_prompt": "당신은 다양한 도구를 활용하여 사용자의 요청을 처리하는 분석 전문가입니다. 데이터베이스 조회, 계산, 텍스트 처리, 데이터 분석 등 다양한 작업을 수행할 수 있습니다.",
+    "tools": ["database_tool", "math_calculator", "text_processor", "data_analyzer"]
+})
+
+# 등록 요청 (라벨, 경로, 미리 직렬화한 JSON 본문) - 3.1~3.4 순서
+TOOL_REGISTRATIONS = (
+    ("API Tool", "/tools/register", orjson.dumps(dict(API_TOOL_DATA))),
+    ("Calculation Tool", "/tools/register", orjson.dumps(dict(CALC_TOOL_DATA))),
+    ("Custom Tool", "/tools/register", orjson.dumps(dict(CUSTOM_TOOL_DATA))),
+    ("Custom Function Tool", "/tools/register-with-code", orjson.dumps(dict(CUSTOM_FUNCTION_TOOL_DATA))),
+)
+AGENT_BODY = orjson.dumps(dict(AGENT_DATA))
+# Agent 호출 payload에서 고정된 부분 (prompt 뒤에 이어 붙임): b'"max_tokens":200,...}'
+INVOKE_BODY_SUFFIX = orjson.dumps({"max_tokens": 200, "temperature": 0.3, "use_tools": True})[1:]
+
+def save_tools_cache(tools):
+    """성공적으로 조회한 Tool 목록을 저장합니다."""
+    try:
+        TOOLS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with shelve.open(str(TOOLS_CACHE_PATH)) as cache:
+            cache["tools"] = (tools, time.time())
+    except TOOLS_CACHE_ERRORS as e:
+        logger.warning("⚠️  Tool 목록 캐시 저장 실패: %s", e)
+
+def load_tools_cache():
+    """1일 이내에 저장된 Tool 목록을 반환합니다 (없거나 오래되면 None)."""
+    try:
+        with shelve.open(str(TOOLS_CACHE_PATH), flag="r") as cache:
+            tools, saved_at = cache["tools"]
+    except (KeyError, ValueError, TypeError, *TOOLS_CACHE_ERRORS):
+        return None
+    if time.time() - saved_at > TOOLS_CACHE_MAX_AGE:
+        return None
+    return tools
+
+def create_async_session() -> aiohttp.ClientSession:
+    """keep-alive 연결을 재사용하는 데모용 aiohttp 세션을 생성합니다."""
+    return aiohttp.ClientSession(
+        base_url=SERVER_URL,
+        # localhost 조회 결과를 캐시하고 호스트당 연결 수를 전체 한도와 맞춥니다
+        connector=aiohttp.TCPConnector(
+            limit=16,
+            limit_per_host=16,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True,
+        ),
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+async def request_json(session: aiohttp.ClientSession, method: str, url: str, **kwargs):
+    """요청을 보내고 (상태 코드, 응답 JSON 또는 본문, 응답 헤더)를 반환합니다."""
+    async with session.request(method, url, **kwargs) as response:
+        if response.status == 200:
+            return response.status, await response.json(), response.headers
+        return response.status, await response.text(), response.headers
+
+async def post_json(session: aiohttp.ClientSession, path: str, payload, **kwargs):
+    """
+    API 경로로 POST하고 (상태 코드, 응답 JSON 또는 본문)을 반환합니다.
+    payload는 dict(orjson으로 직렬화) 또는 미리 직렬화한 JSON bytes입니다.
+    """
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    status, result, _ = await request_json(session, "POST", f"{API_PREFIX}{path}", data=body, headers=JSON_HEADERS, **kwargs)
+    return status, result
+
+async def post_all(session: aiohttp.ClientSession, posts):
+    """(경로, payload) 목록을 동시에 POST하고 결과를 같은 순서로 반환합니다."""
+    return await asyncio.gather(*(post_json(session, path, payload) for path, payload in posts))
+
+async def invoke(session: aiohttp.ClientSession, query: str):
+    """Agent에 쿼리 하나를 보내고 (쿼리, 상태 코드, 응답 JSON 또는 본문)을 반환합니다."""
+    # 쿼리마다 바뀌는 prompt만 직렬화하고 나머지는 미리 만든 bytes를 사용
+    body = b'{"prompt":' + orjson.dumps(query) + b"," + INVOKE_BODY_SUFFIX
+    status, result = await post_json(session, "/agents/multi_tool_analyst/invoke", body, timeout=INVOKE_TIMEOUT)
+    return query, status, result
+
+async def fetch_tool_info(session: aiohttp.ClientSession, name: str):
+    """Tool 상세 정보를 조회하고 (이름, 상태 코드, 응답 JSON 또는 본문)을 반환합니다."""
+    status, result, _ = await request_json(session, "GET", f"{API_PREFIX}/tools/{name}")
+    return name, status, result
+
+def main():
+    logger.info("🚀 PRISM Core Tool System Demo")
+    logger.info("=" * 50)
+    asyncio.run(amain())
+
+async def amain():
+    # 모든 호출이 하나의 세션(연결 풀)을 공유하고, 종료 시 풀을 정리합니다
+    async with create_async_session() as session:
+        await run_demo(session)
+
+async def run_demo(session: aiohttp.ClientSession):
+    try:
+        # 1. 서버 상태 확인
+        logger.info("1. 서버 상태 확인...")
+        try:
+            # 본문 전송이 없는 HEAD로 /health 확인
+            async with session.head("/health", timeout=HEALTH_TIMEOUT) as response:
+                status = response.status
+        except asyncio.TimeoutError:
+            raise aiohttp.ClientConnectionError("health check timed out")
+        if status == 200:
+            logger.info("✅ 서버 연결 성공")
+        else:
+            logger.info("❌ 서버 연결 실패: %s", status)
+            return
         
-        response = requests.post(f"{BASE_URL}/tools/register-with-code", json=custom_function_tool_data)
-        if response.status_code == 200:
-            print(f"✅ Custom Function Tool 등록 성공: {response.json()['message']}")
+        # 2. 등록된 Tool 목록 조회
+        logger.info("\n2. 등록된 Tool 목록 조회...")
+        status, result, headers = await request_json(session, "GET", f"{API_PREFIX}/tools")
+        tools = load_tools_cache() if status >= 500 else None
+        if status == 200:
+            tools = result
+            tools_etag = headers.get("ETag")
+            save_tools_cache(tools)
+            logger.info("✅ 등록된 Tool 수: %s", len(tools))
+            for tool in tools:
+                logger.info("   - %s: %s", tool['name'], tool['description'])
+        elif tools is not None:
+            # 일시적인 서버 오류: 마지막으로 성공한 목록으로 계속 진행
+            tools_etag = None
+            logger.info("⚠️  Tool 목록 조회 실패 (%s) - 캐시된 목록 사용 (stale)", status)
+            logger.info("   캐시된 Tool 수: %s", len(tools))
+            for tool in tools:
+                logger.info("   - %s: %s", tool['name'], tool['description'])
         else:
-            print(f"❌ Custom Function Tool 등록 실패: {response.status_code}, {response.text}")
+            logger.info("❌ Tool 목록 조회 실패: %s", status)
+            return
+        
+        # 3. Client에서 새로운 Tool 등록
+        logger.info("\n3. Client에서 새로운 Tool 등록...")
+        
+        # 3.1~3.4 등록 요청을 동시에 전송하고 순서대로 결과를 출력합니다
+        registration_results = await post_all(session, [(path, body) for _, path, body in TOOL_REGISTRATIONS])
+        for (label, _, _), (status, result) in zip(TOOL_REGISTRATIONS, registration_results):
+            if status == 200:
+                logger.info("✅ %s 등록 성공: %s", label, result['message'])
+            else:
+                logger.info("❌ %s 등록 실패: %s, %s", label, status, result)
         
         # 4. 업데이트된 Tool 목록 확인
-        print("\n4. 업데이트된 Tool 목록 확인...")
-        response = requests.get(f"{BASE_URL}/tools")
-        if response.status_code == 200:
-            tools = response.json()
-            print(f"✅ 총 등록된 Tool 수: {len(tools)}")
+        logger.info("\n4. 업데이트된 Tool 목록 확인...")
+        # 목록이 바뀌지 않았다면 서버는 본문 없이 304를 반환하고 2단계의 목록을 재사용합니다
+        headers = {"If-None-Match": tools_etag} if tools_etag else {}
+        status, result, _ = await request_json(session, "GET", f"{API_PREFIX}/tools", headers=headers)
+        if status in (200, 304):
+            if status == 200:
+                tools = result
+                save_tools_cache(tools)
+            logger.info("✅ 총 등록된 Tool 수: %s", len(tools))
             for tool in tools:
-                print(f"   - {tool['name']}: {tool['description']}")
+                logger.info("   - %s: %s", tool['name'], tool['description'])
+        elif status >= 500:
+            logger.info("⚠️  Tool 목록 조회 실패 (%s) - 이전 목록 사용 (stale)", status)
+            logger.info("   Tool 수: %s", len(tools))
         
         # 5. 새로운 Tool들 직접 테스트
-        print("\n5. 새로운 Tool들 직접 테스트...")
+        logger.info("\n5. 새로운 Tool들 직접 테스트...")
         
-        # 5.1. Math Calculator 테스트
-        print("\n5.1. Math Calculator 테스트...")
         calc_request = {
             "tool_name": "math_calculator",
             "parameters": {
@@ -213,16 +337,6 @@ def main():
                 "variables": {}
             }
         }
-        
-        response = requests.post(f"{BASE_URL}/tools/execute", json=calc_request)
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Calculator 실행 성공: {result['result']}")
-        else:
-            print(f"❌ Calculator 실행 실패: {response.status_code}")
-        
-        # 5.2. Text Processor 테스트
-        print("\n5.2. Text Processor 테스트...")
         text_request = {
             "tool_name": "text_processor",
             "parameters": {
@@ -234,16 +348,6 @@ def main():
                 }
             }
         }
-        
-        response = requests.post(f"{BASE_URL}/tools/execute", json=text_request)
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Text Processor 실행 성공: {result['result']}")
-        else:
-            print(f"❌ Text Processor 실행 실패: {response.status_code}")
-        
-        # 5.3. Custom Function Tool 테스트
-        print("\n5.3. Custom Function Tool 테스트...")
         custom_func_request = {
             "tool_name": "data_analyzer",
             "parameters": {
@@ -252,43 +356,56 @@ def main():
             }
         }
         
-        response = requests.post(f"{BASE_URL}/tools/execute", json=custom_func_request)
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Custom Function Tool 실행 성공:")
-            print(f"   분석 결과: {result['result']['analysis_result']}")
-            print(f"   메시지: {result['result']['message']}")
+        # 세 Tool 실행은 서로 독립적이므로 동시에 요청합니다
+        (calc_status, calc_result), (text_status, text_result), (func_status, func_result) = await post_all(
+            session,
+            [("/tools/execute", calc_request), ("/tools/execute", text_request), ("/tools/execute", custom_func_request)],
+        )
+        
+        # 5.1. Math Calculator 테스트
+        logger.info("\n5.1. Math Calculator 테스트...")
+        if calc_status == 200:
+            logger.info("✅ Calculator 실행 성공: %s", calc_result['result'])
+        else:
+            logger.info("❌ Calculator 실행 실패: %s", calc_status)
+        
+        # 5.2. Text Processor 테스트
+        logger.info("\n5.2. Text Processor 테스트...")
+        if text_status == 200:
+            logger.info("✅ Text Processor 실행 성공: %s", text_result['result'])
         else:
-            print(f"❌ Custom Function Tool 실행 실패: {response.status_code}, {response.text}")
+            logger.info("❌ Text Processor 실행 실패: %s", text_status)
+        
+        # 5.3. Custom Function Tool 테스트
+        logger.info("\n5.3. Custom Function Tool 테스트...")
+        if func_status == 200:
+            logger.info("✅ Custom Function Tool 실행 성공:")
+            logger.info("   분석 결과: %s", func_result['result']['analysis_result'])
+            logger.info("   메시지: %s", func_result['result']['message'])
+        else:
+            logger.info("❌ Custom Function Tool 실행 실패: %s, %s", func_status, func_result)
         
         # 6. Agent 등록 (database tool + 새로운 tools 포함)
-        print("\n6. 다중 Tool을 가진 Agent 등록...")
-        agent_data = {
-            "name": "multi_tool_analyst",
-            "description": "다양한 도구를 활용하는 분석 전문가",
-            "role_prompt": "당신은 다양한 도구를 활용하여 사용자의 요청을 처리하는 분석 전문가입니다. 데이터베이스 조회, 계산, 텍스트 처리, 데이터 분석 등 다양한 작업을 수행할 수 있습니다.",
-            "tools": ["database_tool", "math_calculator", "text_processor", "data_analyzer"]
-        }
+        logger.info("\n6. 다중 Tool을 가진 Agent 등록...")
         
-        response = requests.post(f"{BASE_URL}/agents", json=agent_data)
-        if response.status_code == 200:
-            print(f"✅ Multi-tool Agent 등록 성공: {response.json()['name']}")
+        status, result = await post_json(session, "/agents", AGENT_BODY)
+        if status == 200:
+            logger.info("✅ Multi-tool Agent 등록 성공: %s", result['name'])
         else:
-            print(f"❌ Multi-tool Agent 등록 실패: {response.status_code}, {response.text}")
+            logger.info("❌ Multi-tool Agent 등록 실패: %s, %s", status, result)
         
         # 7. 등록된 Agent 목록 확인
-        print("\n7. 등록된 Agent 목록 확인...")
-        response = requests.get(f"{BASE_URL}/agents")
-        if response.status_code == 200:
-            agents = response.json()
-            print(f"✅ 등록된 Agent 수: {len(agents)}")
+        logger.info("\n7. 등록된 Agent 목록 확인...")
+        status, agents, _ = await request_json(session, "GET", f"{API_PREFIX}/agents")
+        if status == 200:
+            logger.info("✅ 등록된 Agent 수: %s", len(agents))
             for agent in agents:
-                print(f"   - {agent['name']}: {agent['description']}")
+                logger.info("   - %s: %s", agent['name'], agent['description'])
                 if agent['tools']:
-                    print(f"     Tools: {', '.join(agent['tools'])}")
+                    logger.info("     Tools: %s", ', '.join(agent['tools']))
         
         # 8. Database Tool 직접 테스트
-        print("\n8. Database Tool 직접 테스트...")
+        logger.info("\n8. Database Tool 직접 테스트...")
         tool_request = {
             "tool_name": "database_tool",
             "parameters": {
@@ -296,26 +413,25 @@ def main():
             }
         }
         
-        response = requests.post(f"{BASE_URL}/tools/execute", json=tool_request)
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✅ Tool 실행 성공 (실행시간: {result.get('execution_time_ms', 'N/A')}ms)")
+        status, result = await post_json(session, "/tools/execute", tool_request)
+        if status == 200:
+            logger.info("✅ Tool 실행 성공 (실행시간: %sms)", result.get('execution_time_ms', 'N/A'))
             if result['success']:
                 tables = result['result'].get('tables', [])
-                print(f"   데이터베이스 테이블 수: {len(tables)}")
+                logger.info("   데이터베이스 테이블 수: %s", len(tables))
                 if tables:
-                    print("   테이블 목록:")
+                    logger.info("   테이블 목록:")
                     for table in tables[:5]:  # 처음 5개만 표시
-                        print(f"     - {table}")
+                        logger.info("     - %s", table)
                     if len(tables) > 5:
-                        print(f"     ... 및 {len(tables) - 5}개 더")
+                        logger.info("     ... 및 %s개 더", len(tables) - 5)
             else:
-                print(f"   Tool 실행 실패: {result.get('error_message')}")
+                logger.info("   Tool 실행 실패: %s", result.get('error_message'))
         else:
-            print(f"❌ Tool 실행 실패: {response.status_code}, {response.text}")
+            logger.info("❌ Tool 실행 실패: %s, %s", status, result)
         
         # 9. Agent를 통한 자동 Tool 사용 테스트
-        print("\n9. Agent를 통한 자동 Tool 사용 테스트...")
+        logger.info("\n9. Agent를 통한 자동 Tool 사용 테스트...")
         
         test_queries = [
             "데이터베이스에 어떤 테이블들이 있나요?",
@@ -324,64 +440,66 @@ def main():
             "숫자 데이터를 분석해주세요"
         ]
         
-        for i, query in enumerate(test_queries, 1):
-            print(f"\n9.{i} 테스트 쿼리: '{query}'")
+        tool_names = ["database_tool", "math_calculator", "text_processor", "data_analyzer"]
+        # LLM 응답 대기 시간이 겹치도록 쿼리를 동시에 호출하고, 10단계 조회도 한 번에 요청합니다
+        # 한 쿼리가 실패해도 나머지 결과는 보고하도록 예외를 결과로 받습니다
+        query_results = await asyncio.gather(*(invoke(session, query) for query in test_queries), return_exceptions=True)
+        tool_infos = await asyncio.gather(*(fetch_tool_info(session, name) for name in tool_names))
+        
+        for i, (query, query_result) in enumerate(zip(test_queries, query_results), 1):
+            logger.info("\n9.%s 테스트 쿼리: '%s'", i, query)
             
-            agent_request = {
-                "prompt": query,
-                "max_tokens": 200,
-                "temperature": 0.3,
-                "use_tools": True
-            }
+            if isinstance(query_result, Exception):
+                logger.info("❌ Agent 호출 실패: %s: %s", type(query_result).__name__, query_result)
+                continue
             
-            response = requests.post(f"{BASE_URL}/agents/multi_tool_analyst/invoke", json=agent_request)
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✅ Agent 응답 생성 성공")
-                print(f"   사용된 Tools: {result.get('tools_used', [])}")
+            _, status, result = query_result
+            if status == 200:
+                logger.info("✅ Agent 응답 생성 성공")
+                logger.info("   사용된 Tools: %s", result.get('tools_used', []))
                 if result.get('tool_results'):
-                    print(f"   Tool 결과 수: {len(result['tool_results'])}")
-                print(f"   Agent 응답: {result['text'][:200]}{'...' if len(result['text']) > 200 else ''}")
+                    logger.info("   Tool 결과 수: %s", len(result['tool_results']))
+                logger.info("   Agent 응답: %s%s", result['text'][:200], '...' if len(result['text']) > 200 else '')
             else:
-                print(f"❌ Agent 호출 실패: {response.status_code}, {response.text}")
+                logger.info("❌ Agent 호출 실패: %s, %s", status, result)
         
         # 10. Tool 정보 상세 조회
-        print("\n10. Tool 정보 상세 조회...")
-        for tool_name in ["database_tool", "math_calculator", "text_processor", "data_analyzer"]:
-            response = requests.get(f"{BASE_URL}/tools/{tool_name}")
-            if response.status_code == 200:
-                tool_info = response.json()
-                print(f"✅ {tool_name} 정보:")
-                print(f"   타입: {tool_info.get('type', 'unknown')}")
+        logger.info("\n10. Tool 정보 상세 조회...")
+        for tool_name, status, tool_info in tool_infos:
+            if status == 200:
+                logger.info("✅ %s 정보:", tool_name)
+                logger.info("   타입: %s", tool_info.get('type', 'unknown'))
                 if tool_info.get('type') == 'dynamic':
-                    print(f"   Tool 타입: {tool_info.get('tool_type')}")
+                    logger.info("   Tool 타입: %s", tool_info.get('tool_type'))
                     if 'config' in tool_info and 'function_code' in tool_info['config']:
-                        print(f"   사용자 정의 함수: 포함됨")
+                        logger.info("   사용자 정의 함수: 포함됨")
             else:
-                print(f"❌ {tool_name} 정보 조회 실패")
+                logger.info("❌ %s 정보 조회 실패", tool_name)
         
-        print("\n🎉 Client Tool 등록 Demo 완료!")
-        print("\n📚 새로 추가된 API 엔드포인트:")
-        print("   - POST /api/tools/register: 새로운 Tool 등록")
-        print("   - GET /api/tools/{tool_name}: Tool 상세 정보 조회")
-        print("   - DELETE /api/tools/{tool_name}: Tool 삭제")
-        print("   - PUT /api/tools/{tool_name}/config: Tool 설정 업데이트")
-        print("   - POST /api/agents: Agent 등록 (다중 Tool 지원)")
-        print("   - POST /api/agents/{agent_name}/tools: Agent에 Tool 할당")
-        print("   - POST /api/agents/{agent_name}/invoke: Agent 실행 (다중 Tool 자동 사용)")
-        print("   - GET /api/tools: Tool 목록 조회")
-        print("   - POST /api/tools/execute: Tool 직접 실행")
-        print("   - Swagger UI: http://localhost:8000/docs")
+        logger.info("\n🎉 Client Tool 등록 Demo 완료!")
+        logger.info("\n📚 새로 추가된 API 엔드포인트:")
+        logger.info("   - POST /api/tools/register: 새로운 Tool 등록")
+        logger.info("   - GET /api/tools/{tool_name}: Tool 상세 정보 조회")
+        logger.info("   - DELETE /api/tools/{tool_name}: Tool 삭제")
+        logger.info("   - PUT /api/tools/{tool_name}/config: Tool 설정 업데이트")
+        logger.info("   - POST /api/agents: Agent 등록 (다중 Tool 지원)")
+        logger.info("   - POST /api/agents/{agent_name}/tools: Agent에 Tool 할당")
+        logger.info("   - POST /api/agents/{agent_name}/invoke: Agent 실행 (다중 Tool 자동 사용)")
+        logger.info("   - GET /api/tools: Tool 목록 조회")
+        logger.info("   - POST /api/tools/execute: Tool 직접 실행")
+        logger.info("   - Swagger UI: http://localhost:8000/docs")
         
-    except requests.exceptions.ConnectionError:
-        print("❌ 서버에 연결할 수 없습니다. 먼저 서버를 실행해주세요:")
-        print("   docker-compose up -d")
-        print("   또는")
-        print("   ./run.sh")
+    except aiohttp.ClientConnectionError:
+        logger.info("❌ 서버에 연결할 수 없습니다. 먼저 서버를 실행해주세요:")
+        logger.info("   docker-compose up -d")
+        logger.info("   또는")
+        logger.info("   ./run.sh")
     except Exception as e:
-        print(f"❌ 예상치 못한 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ 예상치 못한 오류 발생: %s", e)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    setup_logging()
+    try:
+        main()
+    finally:
+        sys.stdout.flush() 
\ No newline at end of file
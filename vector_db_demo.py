@@ -6,119 +6,132 @@ PRISM Core의 Vector DB 유틸리티 사용법을 보여주는 데모 스크립
 RAG 구현을 위한 Vector Database 기능들을 테스트합니다.
 """
 
+import sys
 import asyncio
 import logging
 from datetime import datetime
 from typing import List
 
-from prism_core.core.vector_db import (
-    WeaviateClient, DocumentSchema, SearchQuery, IndexConfig,
-    EncoderManager, VectorDBAPI
-)
+try:
+    # libuv 기반 이벤트 루프 (Windows 미지원 - 없으면 기본 asyncio 루프 사용)
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from demo_logging import setup_logging
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 테스트 데이터
-SAMPLE_DOCUMENTS = [
-    DocumentSchema(
-        content="제조업에서 품질 관리는 매우 중요합니다. ISO 9001 표준을 따라 품질 시스템을 구축해야 합니다.",
-        title="품질 관리 시스템",
-        source="manufacturing_guide.pdf",
-        metadata={"category": "quality", "language": "ko"}
-    ),
-    DocumentSchema(
-        content="스마트 팩토리는 IoT, AI, 빅데이터 기술을 활용하여 생산성을 향상시킵니다.",
-        title="스마트 팩토리 개요",
-        source="smart_factory.pdf",
-        metadata={"category": "technology", "language": "ko"}
-    ),
-    DocumentSchema(
-        content="공정 자동화를 통해 인적 오류를 줄이고 일관된 품질을 유지할 수 있습니다.",
-        title="공정 자동화",
-        source="automation_guide.pdf",
-        metadata={"category": "automation", "language": "ko"}
-    ),
-    DocumentSchema(
-        content="예측 유지보수는 설비의 고장을 미리 예측하여 다운타임을 최소화합니다.",
-        title="예측 유지보수",
-        source="maintenance.pdf",
-        metadata={"category": "maintenance", "language": "ko"}
-    ),
-    DocumentSchema(
-        content="Supply chain management is crucial for manufacturing efficiency and cost reduction.",
-        title="Supply Chain Management",
-        source="scm_guide.pdf",
-        metadata={"category": "logistics", "language": "en"}
-    )
-]
+
+def get_sample_documents():
+    """테스트 데이터 (DocumentSchema는 필요할 때 import)"""
+    from prism_core.core.vector_db import DocumentSchema
+    
+    return [
+        DocumentSchema(
+            content="제조업에서 품질 관리는 매우 중요합니다. ISO 9001 표준을 따라 품질 시스템을 구축해야 합니다.",
+            title="품질 관리 시스템",
+            source="manufacturing_guide.pdf",
+            metadata={"category": "quality", "language": "ko"}
+        ),
+        DocumentSchema(
+            content="스마트 팩토리는 IoT, AI, 빅데이터 기술을 활용하여 생산성을 향상시킵니다.",
+            title="스마트 팩토리 개요",
+            source="smart_factory.pdf",
+            metadata={"category": "technology", "language": "ko"}
+        ),
+        DocumentSchema(
+            content="공정 자동화를 통해 인적 오류를 줄이고 일관된 품질을 유지할 수 있습니다.",
+            title="공정 자동화",
+            source="automation_guide.pdf",
+            metadata={"category": "automation", "language": "ko"}
+        ),
+        DocumentSchema(
+            content="예측 유지보수는 설비의 고장을 미리 예측하여 다운타임을 최소화합니다.",
+            title="예측 유지보수",
+            source="maintenance.pdf",
+            metadata={"category": "maintenance", "language": "ko"}
+        ),
+        DocumentSchema(
+            content="Supply chain management is crucial for manufacturing efficiency and cost reduction.",
+            title="Supply Chain Management",
+            source="scm_guide.pdf",
+            metadata={"category": "logistics", "language": "en"}
+        )
+    ]
 
 
 async def test_encoder_manager():
     """인코더 매니저 테스트"""
-    print("\n" + "="*60)
-    print("🤖 Encoder Manager 테스트")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("🤖 Encoder Manager 테스트")
+    logger.info("="*60)
     
     try:
+        from prism_core.core.vector_db import EncoderManager
+        
         # 추천 모델 목록 출력
-        print("\n📋 추천 인코더 모델:")
+        logger.info("\n📋 추천 인코더 모델:")
         recommended = EncoderManager.get_recommended_models()
         for name, info in recommended.items():
-            print(f"  - {name}: {info['description']} (차원: {info['vector_dimension']})")
+            logger.info("  - %s: %s (차원: %s)", name, info['description'], info['vector_dimension'])
         
         # 간단한 인코더 테스트 (실제로는 모델을 다운로드해야 함)
-        print(f"\n⚠️  실제 인코더 테스트는 모델 다운로드가 필요하므로 스킵합니다.")
-        print("   사용 예시:")
-        print("   encoder = EncoderManager('intfloat/multilingual-e5-base')")
-        print("   embeddings = encoder.encode_texts(['안녕하세요', 'Hello world'])")
+        logger.info("\n⚠️  실제 인코더 테스트는 모델 다운로드가 필요하므로 스킵합니다.")
+        logger.info("   사용 예시:")
+        logger.info("   encoder = EncoderManager('intfloat/multilingual-e5-base')")
+        logger.info("   embeddings = encoder.encode_texts(['안녕하세요', 'Hello world'])")
         
         return True
         
     except Exception as e:
-        print(f"❌ 인코더 테스트 실패: {e}")
+        logger.info("❌ 인코더 테스트 실패: %s", e)
         return False
 
 
 async def test_weaviate_client():
     """Weaviate 클라이언트 테스트 (Weaviate 서버 없이는 스킵)"""
-    print("\n" + "="*60)
-    print("🗄️  Weaviate Client 테스트")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("🗄️  Weaviate Client 테스트")
+    logger.info("="*60)
     
-    print("⚠️  실제 Weaviate 서버 테스트는 서버가 필요하므로 스킵합니다.")
-    print("   사용 예시:")
-    print("   client = WeaviateClient('http://localhost:8080')")
-    print("   client.connect()")
-    print("   client.add_document('Documents', document)")
-    print("   results = client.search('Documents', query)")
+    logger.info("⚠️  실제 Weaviate 서버 테스트는 서버가 필요하므로 스킵합니다.")
+    logger.info("   사용 예시:")
+    logger.info("   client = WeaviateClient('http://localhost:8080')")
+    logger.info("   client.connect()")
+    logger.info("   client.add_document('Documents', document)")
+    logger.info("   results = client.search('Documents', query)")
     
     # 클라이언트 객체 생성만 테스트
     try:
+        from prism_core.core.vector_db import WeaviateClient
+        
         client = WeaviateClient()
-        print(f"✅ Weaviate 클라이언트 객체 생성 성공")
-        print(f"   URL: {client.url}")
-        print(f"   연결 상태: {client.is_connected()}")
+        logger.info("✅ Weaviate 클라이언트 객체 생성 성공")
+        logger.info("   URL: %s", client.url)
+        logger.info("   연결 상태: %s", client.is_connected())
         return True
     except Exception as e:
-        print(f"❌ 클라이언트 생성 실패: {e}")
+        logger.info("❌ 클라이언트 생성 실패: %s", e)
         return False
 
 
 async def test_schemas():
     """스키마 테스트"""
-    print("\n" + "="*60)
-    print("📋 Schema 테스트")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("📋 Schema 테스트")
+    logger.info("="*60)
     
     try:
+        from prism_core.core.vector_db import SearchQuery, IndexConfig
+        
         # DocumentSchema 테스트
-        doc = SAMPLE_DOCUMENTS[0]
-        print(f"✅ DocumentSchema 생성 성공:")
-        print(f"   제목: {doc.title}")
-        print(f"   내용: {doc.content[:50]}...")
-        print(f"   메타데이터: {doc.metadata}")
+        doc = get_sample_documents()[0]
+        logger.info("✅ DocumentSchema 생성 성공:")
+        logger.info("   제목: %s", doc.title)
+        logger.info("   내용: %s...", doc.content[:50])
+        logger.info("   메타데이터: %s", doc.metadata)
         
         # SearchQuery 테스트
         query = SearchQuery(
@@ -127,10 +140,10 @@ async def test_schemas():
             threshold=0.7,
             filters={"category": "quality"}
         )
-        print(f"\n✅ SearchQuery 생성 성공:")
-        print(f"   쿼리: {query.query}")
-        print(f"   제한: {query.limit}")
-        print(f"   임계값: {query.threshold}")
+        logger.info("\n✅ SearchQuery 생성 성공:")
+        logger.info("   쿼리: %s", query.query)
+        logger.info("   제한: %s", query.limit)
+        logger.info("   임계값: %s", query.threshold)
         
         # IndexConfig 테스트
         config = IndexConfig(
@@ -139,32 +152,30 @@ async def test_schemas():
             vector_dimension=768,
             encoder_model="intfloat/multilingual-e5-base"
         )
-        print(f"\n✅ IndexConfig 생성 성공:")
-        print(f"   클래스명: {config.class_name}")
-        print(f"   벡터 차원: {config.vector_dimension}")
-        print(f"   인코더: {config.encoder_model}")
+        logger.info("\n✅ IndexConfig 생성 성공:")
+        logger.info("   클래스명: %s", config.class_name)
+        logger.info("   벡터 차원: %s", config.vector_dimension)
+        logger.info("   인코더: %s", config.encoder_model)
         
         # Weaviate 스키마 변환 테스트
         weaviate_schema = config.get_weaviate_schema()
-        print(f"\n✅ Weaviate 스키마 변환 성공:")
-        print(f"   클래스: {weaviate_schema['class']}")
-        print(f"   속성 수: {len(weaviate_schema['properties'])}")
+        logger.info("\n✅ Weaviate 스키마 변환 성공:")
+        logger.info("   클래스: %s", weaviate_schema['class'])
+        logger.info("   속성 수: %s", len(weaviate_schema['properties']))
         
         return True
         
     except Exception as e:
-        print(f"❌ 스키마 테스트 실패: {e}")
+        logger.info("❌ 스키마 테스트 실패: %s", e)
         return False
 
 
-async def demo_usage_patterns():
-    """사용 패턴 데모"""
-    print("\n" + "="*60)
-    print("🎯 Vector DB Utils 사용 패턴 데모")
-    print("="*60)
-    
-    print("1️⃣ 기본 사용 패턴:")
-    print("""
+_USAGE_PATTERNS_TEXT = "\n".join([
+    "\n" + "="*60,
+    "🎯 Vector DB Utils 사용 패턴 데모",
+    "="*60,
+    "1️⃣ 기본 사용 패턴:",
+    """
 # 1. 클라이언트 초기화
 from prism_core.core.vector_db import WeaviateClient, EncoderManager, IndexConfig
 
@@ -186,14 +197,15 @@ documents = [
     DocumentSchema(content="...", title="...", metadata={"category": "..."})
 ]
 client.add_documents("Documents", documents)
+# 대량 문서: REST 배치 요청을 100개 단위로 나눠 동시에 전송
+# await client.add_documents_async("Documents", documents, batch_size=100)
 
 # 4. 검색
 query = SearchQuery(query="품질 관리", limit=10)
 results = client.search("Documents", query)
-""")
-    
-    print("\n2️⃣ API 사용 패턴:")
-    print("""
+""",
+    "\n2️⃣ API 사용 패턴:",
+    """
 # FastAPI 앱에 Vector DB API 추가
 from prism_core.core.vector_db import create_vector_db_router
 
@@ -206,24 +218,27 @@ app.include_router(vector_db_router)
 # POST /vector-db/documents/{class_name} - 문서 추가
 # POST /vector-db/search/{class_name} - 검색
 # DELETE /vector-db/documents/{class_name}/{doc_id} - 문서 삭제
-""")
-    
-    print("\n3️⃣ 컨텍스트 매니저 사용:")
-    print("""
+""",
+    "\n3️⃣ 컨텍스트 매니저 사용:",
+    """
 # 자동 연결 관리
 with WeaviateClient('http://localhost:8080') as client:
     client.encoder = EncoderManager('intfloat/multilingual-e5-base')
     results = client.search("Documents", query)
-""")
+""",
+])
 
 
-async def demo_rag_implementation():
-    """RAG 구현 예시"""
-    print("\n" + "="*60)
-    print("🧠 RAG 구현 예시")
-    print("="*60)
-    
-    print("""
+async def demo_usage_patterns():
+    """사용 패턴 데모"""
+    logger.info(_USAGE_PATTERNS_TEXT)
+
+
+_RAG_EXAMPLE_TEXT = "\n".join([
+    "\n" + "="*60,
+    "🧠 RAG 구현 예시",
+    "="*60,
+    """
 RAG (Retrieval-Augmented Generation) 구현 예시:
 
 1. 문서 인덱싱:
@@ -268,14 +283,50 @@ async def rag_query(question: str, class_name: str = "Documents"):
         "relevance_scores": [result.score for result in search_results]
     }}
 ```
-""")
+""",
+])
+
+
+async def demo_rag_implementation():
+    """RAG 구현 예시"""
+    logger.info(_RAG_EXAMPLE_TEXT)
+
+
+_SUMMARY_TEXT = "\n".join([
+    "\n" + "="*60,
+    "🎉 Vector DB Utils Demo 완료!",
+    "="*60,
+    "\n📚 주요 기능:",
+    "  ✅ Weaviate 기반 Vector Database 클라이언트",
+    "  ✅ 다양한 인코더 모델 지원 (HuggingFace, OpenAI)",
+    "  ✅ 문서 인덱싱 및 배치 처리",
+    "  ✅ 유사도 기반 검색",
+    "  ✅ 문서 삭제 및 관리",
+    "  ✅ REST API 인터페이스",
+    "  ✅ RAG 구현 지원",
+    "\n📋 API 엔드포인트:",
+    "  - GET  /vector-db/status - Vector DB 상태 조회",
+    "  - POST /vector-db/indices - 인덱스 생성",
+    "  - DELETE /vector-db/indices/{class_name} - 인덱스 삭제",
+    "  - POST /vector-db/documents/{class_name} - 문서 추가",
+    "  - POST /vector-db/documents/{class_name}/batch - 배치 문서 추가",
+    "  - POST /vector-db/search/{class_name} - 문서 검색",
+    "  - DELETE /vector-db/documents/{class_name}/{doc_id} - 문서 삭제",
+    "  - GET  /vector-db/encoders/recommended - 추천 인코더 목록",
+    "  - POST /vector-db/encoders/test - 인코더 테스트",
+    "\n🔧 설치 및 설정:",
+    "  1. Weaviate 서버 실행: docker run -p 8080:8080 semitechnologies/weaviate:latest",
+    "  2. 필요한 패키지 설치: pip install -r requirements.txt",
+    "  3. 인코더 모델 다운로드 (자동)",
+    "  4. API 서버에 Vector DB 라우터 추가",
+])
 
 
 async def main():
     """메인 데모 함수"""
-    print("🚀 PRISM Core Vector DB Utils Demo")
-    print("=" * 60)
-    print("RAG 구현을 위한 Vector Database 유틸리티 기능을 테스트합니다.")
+    logger.info("🚀 PRISM Core Vector DB Utils Demo")
+    logger.info("=" * 60)
+    logger.info("RAG 구현을 위한 Vector Database 유틸리티 기능을 테스트합니다.")
     
     # 테스트 실행
     tests = [
@@ -284,61 +335,39 @@ async def main():
         ("Weaviate 클라이언트 테스트", test_weaviate_client),
     ]
     
+    # 서로 독립적인 테스트를 동시에 실행 (예외는 결과로 받아 테스트별로 보고)
+    outcomes = await asyncio.gather(*(test_func() for _, test_func in tests), return_exceptions=True)
+    
     results = []
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} 중 오류 발생: {e}")
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            logger.info("❌ %s 중 오류 발생: %s", test_name, outcome)
             results.append((test_name, False))
+        else:
+            results.append((test_name, outcome))
     
     # 사용 패턴 데모
     await demo_usage_patterns()
     await demo_rag_implementation()
     
-    # 결과 요약
-    print("\n" + "="*60)
-    print("📊 테스트 결과 요약")
-    print("="*60)
-    
-    for test_name, success in results:
-        status = "✅ 성공" if success else "❌ 실패"
-        print(f"  {test_name}: {status}")
-    
+    # 결과 요약 (한 번에 출력)
     success_count = sum(1 for _, success in results if success)
-    print(f"\n총 {len(results)}개 테스트 중 {success_count}개 성공")
+    logger.info("\n".join([
+        "\n" + "="*60,
+        "📊 테스트 결과 요약",
+        "="*60,
+        *(f"  {test_name}: {'✅ 성공' if success else '❌ 실패'}" for test_name, success in results),
+        f"\n총 {len(results)}개 테스트 중 {success_count}개 성공",
+    ]))
     
-    print("\n" + "="*60)
-    print("🎉 Vector DB Utils Demo 완료!")
-    print("="*60)
-    
-    print("\n📚 주요 기능:")
-    print("  ✅ Weaviate 기반 Vector Database 클라이언트")
-    print("  ✅ 다양한 인코더 모델 지원 (HuggingFace, OpenAI)")
-    print("  ✅ 문서 인덱싱 및 배치 처리")
-    print("  ✅ 유사도 기반 검색")
-    print("  ✅ 문서 삭제 및 관리")
-    print("  ✅ REST API 인터페이스")
-    print("  ✅ RAG 구현 지원")
-    
-    print("\n📋 API 엔드포인트:")
-    print("  - GET  /vector-db/status - Vector DB 상태 조회")
-    print("  - POST /vector-db/indices - 인덱스 생성")
-    print("  - DELETE /vector-db/indices/{class_name} - 인덱스 삭제")
-    print("  - POST /vector-db/documents/{class_name} - 문서 추가")
-    print("  - POST /vector-db/documents/{class_name}/batch - 배치 문서 추가")
-    print("  - POST /vector-db/search/{class_name} - 문서 검색")
-    print("  - DELETE /vector-db/documents/{class_name}/{doc_id} - 문서 삭제")
-    print("  - GET  /vector-db/encoders/recommended - 추천 인코더 목록")
-    print("  - POST /vector-db/encoders/test - 인코더 테스트")
-    
-    print("\n🔧 설치 및 설정:")
-    print("  1. Weaviate 서버 실행: docker run -p 8080:8080 semitechnologies/weaviate:latest")
-    print("  2. 필요한 패키지 설치: pip install -r requirements.txt")
-    print("  3. 인코더 모델 다운로드 (자동)")
-    print("  4. API 서버에 Vector DB 라우터 추가")
+    logger.info(_SUMMARY_TEXT)
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    setup_logging()
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    try:
+        asyncio.run(main())
+    finally:
+        sys.stdout.flush() 
\ No newline at end of file